@@ -10,45 +10,289 @@ Console Client → REST API → Business Layer → Data Access Layer → Databas
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import sys
-from tabulate import tabulate
-from decimal import Decimal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib encoder/decoder
+    orjson = None
+    import json
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Numbers are sent as JSON numbers; anything else (e.g. a caller-supplied
+# Decimal) is sent as its exact string form, which the API's Decimal fields accept.
+if orjson:
+    def json_dumps(data):
+        return orjson.dumps(data, default=str)
+
+    json_loads = orjson.loads
+else:
+    def json_dumps(data):
+        return json.dumps(data, default=str).encode()
+
+    json_loads = json.loads
+
+
+def build_grid(columns):
+    """
+    Precompute the border and row format strings for a fixed-width grid table.
+
+    Args:
+        columns: List of (header, width, align) tuples, align being '<' or '>'
+
+    Returns:
+        Tuple of (border, header_rule, row_format, header_line)
+    """
+    border = "+" + "+".join("-" * (width + 2) for _, width, _ in columns) + "+"
+    header_rule = border.replace("-", "=")
+    row_format = "|" + "|".join(f" {{:{align}{width}}} " for _, width, align in columns) + "|"
+    header_line = row_format.format(*(header for header, _, _ in columns))
+    return border, header_rule, row_format, header_line
+
+
+def render_grid(grid, rows):
+    """Render rows of preformatted strings into a grid table."""
+    border, header_rule, row_format, header_line = grid
+    lines = [border, header_line, header_rule]
+    for row in rows:
+        lines.append(row_format.format(*row))
+        lines.append(border)
+    return "\n".join(lines)
+
+
+STOCK_GRID = build_grid([
+    ("ID", 6, ">"),
+    ("Ticker", 10, "<"),
+    ("Company", 30, "<"),
+    ("Price", 12, ">"),
+    ("Sector", 22, "<"),
+])
+
+TRANSACTION_GRID = build_grid([
+    ("ID", 6, ">"),
+    ("Type", 4, "<"),
+    ("Ticker", 10, "<"),
+    ("Qty", 8, ">"),
+    ("Price", 12, ">"),
+    ("Total", 14, ">"),
+])
+
+
+class RateLimiter:
+    """Token-bucket rate limiter shared by every thread using one client."""
+
+    def __init__(self, rate, burst):
+        """
+        Initialize rate limiter.
+
+        Args:
+            rate: Sustained requests per second
+            burst: Maximum requests that may be sent back-to-back
+        """
+        self.rate = rate
+        self.capacity = burst
+        self._tokens = burst
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request token is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity,
+                                   self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
 
 
 class StockTrackerAPIClient:
     """Client for interacting with Stock Portfolio Tracker REST API."""
 
-    def __init__(self, base_url="https://csce-548-stock-tracker-production.up.railway.app"):
+    def __init__(self, base_url="https://csce-548-stock-tracker-production.up.railway.app",
+                 cache_ttl=30, timeout=10, max_requests_per_second=20):
         """
         Initialize API client.
 
         Args:
             base_url: Base URL of the API server (default: Railway production URL)
+            cache_ttl: Seconds to reuse responses from read-only endpoints (0 disables)
+            timeout: Seconds to wait on any single request before giving up
+            max_requests_per_second: Client-side rate limit so bursts don't overrun the server
         """
         self.base_url = base_url
         self.api_v1 = f"{base_url}/api/v1"
+        self.cache_ttl = cache_ttl
+        self.timeout = timeout
+        self._cache = {}  # {url: (fetched_at, data)}
+        self._health = None  # (checked_at, is_online)
+
+        # Endpoint URLs are fixed after construction, so build them once
+        self._url_health = f"{base_url}/health"
+        self._url_batch = f"{self.api_v1}/batch"
+        self._url_users = f"{self.api_v1}/users"
+        self._url_user = self._url_users + "/{}"
+        self._url_user_balance = self._url_users + "/{}/balance"
+        self._url_user_portfolios = self._url_users + "/{}/portfolios"
+        self._url_user_transactions = self._url_users + "/{}/transactions"
+        self._url_user_watchlist = self._url_users + "/{}/watchlist"
+        self._url_user_alerts = self._url_users + "/{}/watchlist/alerts"
+        self._url_stocks = f"{self.api_v1}/stocks"
+        self._url_stock = self._url_stocks + "/{}"
+        self._url_stock_price = self._url_stocks + "/{}/price"
+        self._url_stock_ticker = self._url_stocks + "/ticker/{}"
+        self._url_stock_sector = self._url_stocks + "/sector/{}"
+        self._url_portfolios = f"{self.api_v1}/portfolios"
+        self._url_portfolio = self._url_portfolios + "/{}"
+        self._url_transactions = f"{self.api_v1}/transactions"
+        self._url_transaction = self._url_transactions + "/{}"
+        self._url_watchlist = f"{self.api_v1}/watchlist"
+
+        # Reuse one session so keep-alive pools the underlying sockets
+        self.session = requests.Session()
+        # Back off exponentially on overload responses, honoring Retry-After.
+        # Only idempotent methods are retried: a PUT balance "add" that failed
+        # after the server applied it must not be applied twice. A 500 is a
+        # server bug, not overload, so it surfaces at once.
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(429, 502, 503, 504),
+            allowed_methods=frozenset({"GET", "HEAD", "DELETE"}),
+            respect_retry_after_header=True
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.rate_limiter = RateLimiter(rate=max_requests_per_second, burst=16)
+
+    def __enter__(self):
+        """Support use as a context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the session when leaving the context."""
+        self.close()
+
+    def close(self):
+        """Close the underlying HTTP session."""
+        self.session.close()
+
+    def _request(self, method, url, data=None):
+        """Send a request and return the decoded JSON response body."""
+        self.rate_limiter.acquire()
+        if data is None:
+            response = self.session.request(method, url, timeout=self.timeout)
+        else:
+            response = self.session.request(method, url, data=json_dumps(data),
+                                            headers=JSON_HEADERS, timeout=self.timeout)
+        response.raise_for_status()
+        return json_loads(response.content)
+
+    def _stream(self, url):
+        """Yield objects from an NDJSON list endpoint as they arrive."""
+        self.rate_limiter.acquire()
+        with self.session.get(url, params={"format": "ndjson"}, stream=True,
+                              timeout=self.timeout) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if line:
+                    yield json_loads(line)
+
+    def _cached_get(self, url):
+        """GET a read-only endpoint, serving repeat calls from the TTL cache."""
+        now = time.monotonic()
+        entry = self._cache.get(url)
+        if entry and now - entry[0] < self.cache_ttl:
+            return entry[1]
+
+        data = self._request("GET", url)
+        if self.cache_ttl > 0:
+            self._cache[url] = (now, data)
+        return data
+
+    def invalidate_cache(self, prefix=""):
+        """Drop cached responses for URLs under /api/v1{prefix}."""
+        prefix = f"{self.api_v1}{prefix}"
+        for url in [url for url in self._cache if url.startswith(prefix)]:
+            self._cache.pop(url, None)
+
+    def fan_out(self, func, args_list, max_workers=8):
+        """
+        Run independent API calls concurrently over the shared session.
+
+        Args:
+            func: Client method to call (e.g. self.get_stock)
+            args_list: List of argument tuples, one per call
+            max_workers: Maximum number of requests in flight at once
+
+        Returns:
+            List of results in the same order as args_list
+        """
+        if not args_list:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(args_list))) as executor:
+            return list(executor.map(lambda args: func(*args), args_list))
+
+    def check_connection(self, max_age=5):
+        """
+        Check if API server is running.
+
+        Args:
+            max_age: Seconds a previous health check result may be reused (0 forces a new check)
+        """
+        now = time.monotonic()
+        if self._health is not None and now - self._health[0] < max_age:
+            return self._health[1]
 
-    def check_connection(self):
-        """Check if API server is running."""
         try:
-            response = requests.get(f"{self.base_url}/health", timeout=2)
-            return response.status_code == 200
+            response = self.session.get(self._url_health, timeout=2)
+            is_online = response.status_code == 200
         except requests.exceptions.RequestException:
-            return False
+            is_online = False
+
+        self._health = (now, is_online)
+        return is_online
+
+    def batch(self, calls):
+        """
+        Send several API calls to the server in one round-trip.
+
+        Args:
+            calls: List of {"method": ..., "path": ..., "body": ...} dicts,
+                   with paths relative to /api/v1 (e.g. "/stocks/1")
+
+        Returns:
+            List of {"status": ..., "body": ...} results in call order
+        """
+        result = self._request("POST", self._url_batch, {"pipeline": calls})
+        if any(call['method'] != 'GET' for call in calls):
+            self.invalidate_cache()
+        return result['results']
 
     # ==================== User Operations ====================
 
     def get_all_users(self):
         """Get all users from API."""
-        response = requests.get(f"{self.api_v1}/users")
-        response.raise_for_status()
-        return response.json()
+        return self._cached_get(self._url_users)
+
+    def iter_all_users(self):
+        """Stream all users from API one at a time."""
+        return self._stream(self._url_users)
 
     def get_user(self, user_id):
         """Get specific user."""
-        response = requests.get(f"{self.api_v1}/users/{user_id}")
-        response.raise_for_status()
-        return response.json()
+        return self._request("GET", self._url_user.format(user_id))
 
     def create_user(self, username, email, password, first_name, last_name, initial_balance=10000.00):
         """Create a new user."""
@@ -60,9 +304,9 @@ class StockTrackerAPIClient:
             "last_name": last_name,
             "initial_balance": initial_balance
         }
-        response = requests.post(f"{self.api_v1}/users", json=data)
-        response.raise_for_status()
-        return response.json()
+        result = self._request("POST", self._url_users, data)
+        self.invalidate_cache("/users")
+        return result
 
     def update_user_balance(self, user_id, amount, operation="add"):
         """Update user balance."""
@@ -70,41 +314,41 @@ class StockTrackerAPIClient:
             "amount": amount,
             "operation": operation
         }
-        response = requests.put(f"{self.api_v1}/users/{user_id}/balance", json=data)
-        response.raise_for_status()
-        return response.json()
+        result = self._request("PUT", self._url_user_balance.format(user_id), data)
+        self.invalidate_cache("/users")
+        return result
 
     def delete_user(self, user_id):
         """Delete a user."""
-        response = requests.delete(f"{self.api_v1}/users/{user_id}")
-        response.raise_for_status()
-        return response.json()
+        result = self._request("DELETE", self._url_user.format(user_id))
+        self.invalidate_cache("/users")
+        return result
 
     # ==================== Stock Operations ====================
 
     def get_all_stocks(self):
         """Get all stocks from API."""
-        response = requests.get(f"{self.api_v1}/stocks")
-        response.raise_for_status()
-        return response.json()
+        return self._cached_get(self._url_stocks)
+
+    def iter_all_stocks(self):
+        """Stream all stocks from API one at a time."""
+        return self._stream(self._url_stocks)
 
     def get_stock(self, stock_id):
         """Get specific stock."""
-        response = requests.get(f"{self.api_v1}/stocks/{stock_id}")
-        response.raise_for_status()
-        return response.json()
+        return self._cached_get(self._url_stock.format(stock_id))
+
+    def get_stocks(self, stock_ids, max_workers=8):
+        """Get several stocks concurrently."""
+        return self.fan_out(self.get_stock, [(stock_id,) for stock_id in stock_ids], max_workers)
 
     def search_stock_by_ticker(self, ticker):
         """Search stock by ticker symbol."""
-        response = requests.get(f"{self.api_v1}/stocks/ticker/{ticker}")
-        response.raise_for_status()
-        return response.json()
+        return self._cached_get(self._url_stock_ticker.format(ticker))
 
     def get_stocks_by_sector(self, sector):
         """Get stocks in a specific sector."""
-        response = requests.get(f"{self.api_v1}/stocks/sector/{sector}")
-        response.raise_for_status()
-        return response.json()
+        return self._cached_get(self._url_stock_sector.format(sector))
 
     def create_stock(self, ticker, company_name, current_price, market_cap, sector, industry=None):
         """Create a new stock."""
@@ -116,42 +360,40 @@ class StockTrackerAPIClient:
             "sector": sector,
             "industry": industry
         }
-        response = requests.post(f"{self.api_v1}/stocks", json=data)
-        response.raise_for_status()
-        return response.json()
+        result = self._request("POST", self._url_stocks, data)
+        self.invalidate_cache("/stocks")
+        return result
 
     def update_stock_price(self, stock_id, new_price):
         """Update stock price."""
         data = {"new_price": new_price}
-        response = requests.put(f"{self.api_v1}/stocks/{stock_id}/price", json=data)
-        response.raise_for_status()
-        return response.json()
+        result = self._request("PUT", self._url_stock_price.format(stock_id), data)
+        self.invalidate_cache("/stocks")
+        return result
 
     def delete_stock(self, stock_id):
         """Delete a stock."""
-        response = requests.delete(f"{self.api_v1}/stocks/{stock_id}")
-        response.raise_for_status()
-        return response.json()
+        result = self._request("DELETE", self._url_stock.format(stock_id))
+        self.invalidate_cache("/stocks")
+        return result
 
     # ==================== Portfolio Operations ====================
 
     def get_all_portfolios(self):
         """Get all portfolios."""
-        response = requests.get(f"{self.api_v1}/portfolios")
-        response.raise_for_status()
-        return response.json()
+        return self._request("GET", self._url_portfolios)
+
+    def iter_all_portfolios(self):
+        """Stream all portfolios from API one at a time."""
+        return self._stream(self._url_portfolios)
 
     def get_portfolio(self, portfolio_id):
         """Get specific portfolio."""
-        response = requests.get(f"{self.api_v1}/portfolios/{portfolio_id}")
-        response.raise_for_status()
-        return response.json()
+        return self._request("GET", self._url_portfolio.format(portfolio_id))
 
     def get_user_portfolios(self, user_id):
         """Get all portfolios for a user."""
-        response = requests.get(f"{self.api_v1}/users/{user_id}/portfolios")
-        response.raise_for_status()
-        return response.json()
+        return self._request("GET", self._url_user_portfolios.format(user_id))
 
     def create_portfolio(self, user_id, portfolio_name, description=None):
         """Create a new portfolio."""
@@ -160,29 +402,25 @@ class StockTrackerAPIClient:
             "portfolio_name": portfolio_name,
             "description": description
         }
-        response = requests.post(f"{self.api_v1}/portfolios", json=data)
-        response.raise_for_status()
-        return response.json()
+        return self._request("POST", self._url_portfolios, data)
 
     def delete_portfolio(self, portfolio_id):
         """Delete a portfolio."""
-        response = requests.delete(f"{self.api_v1}/portfolios/{portfolio_id}")
-        response.raise_for_status()
-        return response.json()
+        return self._request("DELETE", self._url_portfolio.format(portfolio_id))
 
     # ==================== Transaction Operations ====================
 
     def get_all_transactions(self):
         """Get all transactions."""
-        response = requests.get(f"{self.api_v1}/transactions")
-        response.raise_for_status()
-        return response.json()
+        return self._request("GET", self._url_transactions)
+
+    def iter_all_transactions(self):
+        """Stream all transactions from API one at a time."""
+        return self._stream(self._url_transactions)
 
     def get_user_transactions(self, user_id):
         """Get all transactions for a user."""
-        response = requests.get(f"{self.api_v1}/users/{user_id}/transactions")
-        response.raise_for_status()
-        return response.json()
+        return self._request("GET", self._url_user_transactions.format(user_id))
 
     def create_transaction(self, user_id, stock_id, portfolio_id, transaction_type, quantity, price_per_share, notes=None):
         """Create a new transaction."""
@@ -195,23 +433,19 @@ class StockTrackerAPIClient:
             "price_per_share": price_per_share,
             "notes": notes
         }
-        response = requests.post(f"{self.api_v1}/transactions", json=data)
-        response.raise_for_status()
-        return response.json()
+        result = self._request("POST", self._url_transactions, data)
+        self.invalidate_cache("/users")
+        return result
 
     def delete_transaction(self, transaction_id):
         """Delete a transaction."""
-        response = requests.delete(f"{self.api_v1}/transactions/{transaction_id}")
-        response.raise_for_status()
-        return response.json()
+        return self._request("DELETE", self._url_transaction.format(transaction_id))
 
     # ==================== Watchlist Operations ====================
 
     def get_user_watchlist(self, user_id):
         """Get user's watchlist."""
-        response = requests.get(f"{self.api_v1}/users/{user_id}/watchlist")
-        response.raise_for_status()
-        return response.json()
+        return self._request("GET", self._url_user_watchlist.format(user_id))
 
     def add_to_watchlist(self, user_id, stock_id, target_price=None, notes=None, alert_enabled=False):
         """Add stock to watchlist."""
@@ -222,15 +456,11 @@ class StockTrackerAPIClient:
             "notes": notes,
             "alert_enabled": alert_enabled
         }
-        response = requests.post(f"{self.api_v1}/watchlist", json=data)
-        response.raise_for_status()
-        return response.json()
+        return self._request("POST", self._url_watchlist, data)
 
     def check_price_alerts(self, user_id):
         """Check for price alerts."""
-        response = requests.get(f"{self.api_v1}/users/{user_id}/watchlist/alerts")
-        response.raise_for_status()
-        return response.json()
+        return self._request("GET", self._url_user_alerts.format(user_id))
 
 
 class APIClientConsole:
@@ -259,9 +489,15 @@ class APIClientConsole:
         print("4.  Search Stock by Ticker (via API)")
         print("5.  Test Full CRUD Operations")
         print("6.  View All Users (via API)")
+        print("7.  View Multiple Stocks by ID (via API)")
+        print("8.  View Transactions for Multiple Users (via API)")
         print("0.  Exit")
         print("-" * 70)
 
+    def _read_ids(self, prompt):
+        """Read a comma- or space-separated list of integer IDs in one prompt."""
+        return [int(part) for part in input(prompt).replace(",", " ").split()]
+
     def view_all_stocks(self):
         """Display all stocks via API."""
         print("\n" + "=" * 70)
@@ -269,17 +505,10 @@ class APIClientConsole:
         print("=" * 70 + "\n")
 
         try:
-            result = self.client.get_all_stocks()
-            stocks = result.get('stocks', [])
-
-            if not stocks:
-                print("No stocks found.")
-                return
-
-            headers = ["ID", "Ticker", "Company", "Price", "Sector"]
             table_data = []
 
-            for stock in stocks:
+            # Rows are formatted as they stream in rather than after the full body is parsed
+            for stock in self.client.iter_all_stocks():
                 table_data.append([
                     stock['stock_id'],
                     stock['ticker_symbol'],
@@ -288,8 +517,12 @@ class APIClientConsole:
                     stock['sector']
                 ])
 
-            print(tabulate(table_data, headers=headers, tablefmt="grid"))
-            print(f"\nTotal Stocks: {result.get('count', 0)}")
+            if not table_data:
+                print("No stocks found.")
+                return
+
+            sys.stdout.write(render_grid(STOCK_GRID, table_data) + "\n")
+            print(f"\nTotal Stocks: {len(table_data)}")
             print("✓ Data retrieved via REST API")
 
         except requests.exceptions.RequestException as e:
@@ -311,7 +544,6 @@ class APIClientConsole:
                 print("No transactions found for this user.")
                 return
 
-            headers = ["ID", "Type", "Ticker", "Qty", "Price", "Total"]
             table_data = []
 
             for txn in transactions:
@@ -324,7 +556,7 @@ class APIClientConsole:
                     f"${txn['total_amount']:.2f}"
                 ])
 
-            print("\n" + tabulate(table_data, headers=headers, tablefmt="grid"))
+            sys.stdout.write("\n" + render_grid(TRANSACTION_GRID, table_data) + "\n")
             print(f"\nTotal Transactions: {result.get('count', 0)}")
             print("✓ Data retrieved via REST API")
 
@@ -333,6 +565,101 @@ class APIClientConsole:
         except requests.exceptions.RequestException as e:
             print(f"✗ API Error: {e}")
 
+    def view_stock_details_bulk(self):
+        """Display several stocks at once, fetched concurrently via API."""
+        print("\n" + "=" * 70)
+        print(" " * 17 + "STOCK DETAILS (via REST API)")
+        print("=" * 70 + "\n")
+
+        try:
+            stock_ids = self._read_ids("Enter Stock IDs (comma-separated): ")
+        except ValueError:
+            print("Invalid Stock ID list")
+            return
+
+        if not stock_ids:
+            return
+
+        def fetch_stock(stock_id):
+            try:
+                return self.client.get_stock(stock_id)
+            except requests.exceptions.RequestException:
+                return None
+
+        # Cap in-flight requests at the session's connection pool size
+        stocks = self.client.fan_out(fetch_stock, [(stock_id,) for stock_id in stock_ids],
+                                     max_workers=16)
+
+        table_data = []
+        missing = []
+
+        for stock_id, stock in zip(stock_ids, stocks):
+            if stock is None:
+                missing.append(str(stock_id))
+                continue
+            table_data.append([
+                stock['stock_id'],
+                stock['ticker_symbol'],
+                stock['company_name'][:30],
+                f"${stock['current_price']:.2f}",
+                stock['sector']
+            ])
+
+        if table_data:
+            sys.stdout.write(render_grid(STOCK_GRID, table_data) + "\n")
+        if missing:
+            print(f"\nNot found: {', '.join(missing)}")
+        print("✓ Data retrieved via REST API")
+
+    def view_transactions_bulk(self):
+        """Display transactions for several users, fetched concurrently via API."""
+        print("\n" + "=" * 70)
+        print(" " * 13 + "TRANSACTIONS FOR MULTIPLE USERS (via REST API)")
+        print("=" * 70 + "\n")
+
+        try:
+            user_ids = self._read_ids("Enter User IDs (comma-separated): ")
+        except ValueError:
+            print("Invalid User ID list")
+            return
+
+        if not user_ids:
+            return
+
+        def fetch_transactions(user_id):
+            try:
+                return self.client.get_user_transactions(user_id)
+            except requests.exceptions.RequestException:
+                return None
+
+        results = self.client.fan_out(fetch_transactions, [(user_id,) for user_id in user_ids],
+                                      max_workers=16)
+
+        for user_id, result in zip(user_ids, results):
+            print(f"\nUser {user_id}:")
+            if result is None:
+                print("  ✗ Could not retrieve transactions")
+                continue
+
+            transactions = result.get('transactions', [])
+            if not transactions:
+                print("  No transactions found.")
+                continue
+
+            table_data = []
+            for txn in transactions:
+                table_data.append([
+                    txn['transaction_id'],
+                    txn['transaction_type'],
+                    txn['ticker_symbol'],
+                    txn['quantity'],
+                    f"${txn['price_per_share']:.2f}",
+                    f"${txn['total_amount']:.2f}"
+                ])
+            sys.stdout.write(render_grid(TRANSACTION_GRID, table_data) + "\n")
+
+        print("\n✓ Data retrieved via REST API")
+
     def test_full_crud(self):
         """Test complete CRUD cycle via API."""
         print("\n" + "=" * 70)
@@ -434,6 +761,10 @@ class APIClientConsole:
                     result = self.client.get_all_users()
                     print(f"\nFound {result.get('count', 0)} users")
                     print("✓ Data retrieved via REST API")
+                elif choice == '7':
+                    self.view_stock_details_bulk()
+                elif choice == '8':
+                    self.view_transactions_bulk()
                 elif choice == '0':
                     print("\n" + "=" * 70)
                     print(" " * 20 + "Thank you for using")
@@ -6,13 +6,17 @@ This layer enforces business rules, validates data, and provides
 higher-level operations for the service layer.
 """
 
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional, Tuple
+import hashlib
+import math
 import re
+import string
 
 # Import Data Access Layer
 from data_access_layer import (
+    DatabaseConnection,
     UserDAO,
     StockDAO,
     PortfolioDAO,
@@ -20,6 +24,68 @@ from data_access_layer import (
     WatchlistDAO
 )
 
+# Validation patterns, compiled once at import. Each is a single character
+# class matched with fullmatch(), so matching is linear with no backtracking.
+_USERNAME_RE = re.compile(r'[a-zA-Z0-9_]+')
+_TICKER_RE = re.compile(r'[A-Z]{1,10}')
+
+# Transaction types
+TXN_BUY = 'BUY'
+TXN_SELL = 'SELL'
+_TXN_TYPES = frozenset((TXN_BUY, TXN_SELL))
+
+# Response message templates
+_MSG_USER_CREATED = 'User {} created successfully'
+_MSG_USERS_CREATED = '{} users created successfully'
+_MSG_STOCK_CREATED = 'Stock {} created successfully'
+_MSG_STOCKS_CREATED = '{} stocks created successfully'
+_MSG_PORTFOLIO_CREATED = 'Portfolio "{}" created successfully'
+_MSG_TXN_CREATED = '{} transaction created successfully'
+_MSG_WATCHLIST_ADDED = 'Added {} to watchlist'
+_MSG_PRICE_ALERT = '{} has reached target price!'
+
+# Money columns are DECIMAL(_, 2)
+_CENT = Decimal('0.01')
+
+# Allowed characters for email validation
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + "._%+-")
+_EMAIL_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + ".-")
+_EMAIL_TLD_CHARS = frozenset(string.ascii_letters)
+
+
+def to_money(value):
+    """
+    Convert a float amount from the API to a cent-quantized Decimal; Decimals
+    and None pass through. repr() gives the shortest string that round-trips,
+    so a parsed "19.99" comes back as Decimal('19.99'), not its binary value.
+    Infinity, NaN and amounts too large to hold in cents are rejected.
+    """
+    if isinstance(value, float):
+        try:
+            if math.isfinite(value):
+                return Decimal(repr(value)).quantize(_CENT)
+        except InvalidOperation:
+            pass
+        raise BusinessRuleException(f"Invalid amount: {value}")
+    return value
+
+
+def is_valid_email(email: str) -> bool:
+    """
+    Check email format as local@domain.tld in a single linear pass.
+
+    Accepts the same addresses as ^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}$
+    without a regex engine, so adversarial input can't trigger backtracking.
+    """
+    local, sep, domain = email.partition('@')
+    if not sep or not local or not _EMAIL_LOCAL_CHARS.issuperset(local):
+        return False
+
+    host, dot, tld = domain.rpartition('.')
+    if not dot or not host or len(tld) < 2:
+        return False
+    return _EMAIL_DOMAIN_CHARS.issuperset(host) and _EMAIL_TLD_CHARS.issuperset(tld)
+
 
 class BusinessRuleException(Exception):
     """Custom exception for business rule violations."""
@@ -42,27 +108,9 @@ class UserBusinessLogic:
         - Password must be at least 8 characters
         - Initial balance must be >= 0
         """
-        # Validate username
-        if not username or len(username) < 3 or len(username) > 50:
-            raise BusinessRuleException("Username must be 3-50 characters")
-        if not re.match(r'^[a-zA-Z0-9_]+$', username):
-            raise BusinessRuleException("Username must be alphanumeric")
-
-        # Validate email
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, email):
-            raise BusinessRuleException("Invalid email format")
-
-        # Validate password
-        if len(password) < 8:
-            raise BusinessRuleException("Password must be at least 8 characters")
-
-        # Hash password (simple hash for demo - use bcrypt in production)
-        password_hash = f"$2b$12${hash(password)}"
-
-        # Validate balance
-        if initial_balance < 0:
-            raise BusinessRuleException("Initial balance cannot be negative")
+        initial_balance = to_money(initial_balance)
+        UserBusinessLogic._validate_user(username, email, password, initial_balance)
+        password_hash = UserBusinessLogic._hash_password(password)
 
         # Create user
         user_id = UserDAO.create(username, email, password_hash,
@@ -72,7 +120,7 @@ class UserBusinessLogic:
             return {
                 'success': True,
                 'user_id': user_id,
-                'message': f'User {username} created successfully'
+                'message': _MSG_USER_CREATED.format(username)
             }
         else:
             return {
@@ -80,23 +128,109 @@ class UserBusinessLogic:
                 'message': 'Failed to create user - username or email may already exist'
             }
 
+    @staticmethod
+    def create_users_bulk(records: List[Dict]) -> Dict:
+        """
+        Create many users, validating every record before any are written.
+
+        Each record takes the same keys as create_user(). If any record is
+        invalid, nothing is created and the error names the offending record.
+        Valid batches are inserted in one transaction, so they succeed or fail as a whole.
+        """
+        rows = []
+        for index, record in enumerate(records):
+            try:
+                initial_balance = to_money(record.get('initial_balance', Decimal('10000.00')))
+                UserBusinessLogic._validate_user(
+                    record.get('username'), record.get('email'), record.get('password'),
+                    initial_balance
+                )
+                if record.get('first_name') is None or record.get('last_name') is None:
+                    raise BusinessRuleException("First and last name are required")
+            except BusinessRuleException as e:
+                raise BusinessRuleException(f"User record {index}: {e}")
+            rows.append((record['username'], record['email'],
+                         UserBusinessLogic._hash_password(record['password']),
+                         record['first_name'], record['last_name'], initial_balance))
+
+        user_ids = UserDAO.create_many(rows)
+
+        if user_ids:
+            return {
+                'success': True,
+                'created': len(user_ids),
+                'user_ids': user_ids,
+                'message': _MSG_USERS_CREATED.format(len(user_ids))
+            }
+        else:
+            return {
+                'success': False,
+                'created': 0,
+                'message': 'Failed to create users - a username or email may already exist'
+            }
+
+    @staticmethod
+    def _validate_user(username: str, email: str, password: str,
+                       initial_balance: Decimal) -> None:
+        """Apply the user creation business rules, raising on the first violation."""
+        # Validate username
+        if not username or len(username) < 3 or len(username) > 50:
+            raise BusinessRuleException("Username must be 3-50 characters")
+        if not _USERNAME_RE.fullmatch(username):
+            raise BusinessRuleException("Username must be alphanumeric")
+
+        # Validate email
+        if not email or not is_valid_email(email):
+            raise BusinessRuleException("Invalid email format")
+
+        # Validate password
+        if not password or len(password) < 8:
+            raise BusinessRuleException("Password must be at least 8 characters")
+
+        # Validate balance
+        if initial_balance < 0:
+            raise BusinessRuleException("Initial balance cannot be negative")
+
+    @staticmethod
+    def _hash_password(password: str) -> str:
+        """Hash password with SHA-256 (demo only - use bcrypt in production)."""
+        return "$2b$12$" + hashlib.sha256(password.encode('utf-8')).hexdigest()
+
     @staticmethod
     def get_user(user_id: int) -> Optional[Dict]:
         """Get user by ID."""
-        user = UserDAO.read_by_id(user_id)
+        return UserBusinessLogic._public_user(UserDAO.read_by_id(user_id))
+
+    @staticmethod
+    def peek_user(user_id: int) -> Optional[Dict]:
+        """Get user by ID if it is cached in this process, without blocking on the database."""
+        return UserBusinessLogic._public_user(UserDAO.peek_by_id(user_id))
+
+    @staticmethod
+    def _public_user(user: Optional[Dict]) -> Optional[Dict]:
+        """Project a user row's public fields rather than mutating the DAO's row."""
         if user:
-            # Remove sensitive data
-            user.pop('password_hash', None)
-            return user
+            return {
+                'user_id': user['user_id'],
+                'username': user['username'],
+                'email': user['email'],
+                'first_name': user['first_name'],
+                'last_name': user['last_name'],
+                'account_balance': user['account_balance'],
+                'created_at': user['created_at'],
+                'last_login': user['last_login']
+            }
         return None
 
     @staticmethod
     def get_all_users() -> List[Dict]:
         """Get all users (without passwords)."""
-        users = UserDAO.read_all()
-        for user in users:
-            user.pop('password_hash', None)
-        return users
+        return UserDAO.read_all_public()
+
+    @staticmethod
+    def get_users_page(after_id: int = 0, limit: int = 100) -> Tuple[List[Dict], Optional[int]]:
+        """Get one page of users by user_id; returns (users, next after_id or None)."""
+        return UserDAO.read_page(after_id, limit)
 
     @staticmethod
     def update_user_balance(user_id: int, amount: Decimal, operation: str = 'add') -> Dict:
@@ -107,6 +241,7 @@ class UserBusinessLogic:
         - Balance cannot go negative
         - Amount must be positive
         """
+        amount = to_money(amount)
         if amount <= 0:
             raise BusinessRuleException("Amount must be positive")
 
@@ -129,9 +264,9 @@ class UserBusinessLogic:
 
         return {
             'success': success,
-            'previous_balance': float(current_balance),
-            'new_balance': float(new_balance),
-            'message': f'Balance updated successfully'
+            'previous_balance': current_balance,
+            'new_balance': new_balance,
+            'message': 'Balance updated successfully'
         }
 
     @staticmethod
@@ -158,18 +293,8 @@ class StockBusinessLogic:
         - Price must be positive
         - Market cap must be positive
         """
-        # Validate ticker
-        ticker = ticker.upper().strip()
-        if not re.match(r'^[A-Z]{1,10}$', ticker):
-            raise BusinessRuleException("Ticker must be 1-10 uppercase letters")
-
-        # Validate price
-        if current_price <= 0:
-            raise BusinessRuleException("Stock price must be positive")
-
-        # Validate market cap
-        if market_cap <= 0:
-            raise BusinessRuleException("Market cap must be positive")
+        current_price = to_money(current_price)
+        ticker = StockBusinessLogic._validate_stock(ticker, current_price, market_cap)
 
         stock_id = StockDAO.create(ticker, company_name, current_price,
                                   market_cap, sector, industry)
@@ -178,7 +303,7 @@ class StockBusinessLogic:
             return {
                 'success': True,
                 'stock_id': stock_id,
-                'message': f'Stock {ticker} created successfully'
+                'message': _MSG_STOCK_CREATED.format(ticker)
             }
         else:
             return {
@@ -186,20 +311,92 @@ class StockBusinessLogic:
                 'message': 'Failed to create stock - ticker may already exist'
             }
 
+    @staticmethod
+    def create_stocks_bulk(records: List[Dict]) -> Dict:
+        """
+        Create many stocks, validating every record before any are written.
+
+        Each record takes the same keys as create_stock(). If any record is
+        invalid, nothing is created and the error names the offending record.
+        Valid batches are inserted in one transaction, so they succeed or fail as a whole.
+        """
+        tickers, rows = [], []
+        for index, record in enumerate(records):
+            try:
+                current_price = to_money(record.get('current_price'))
+                ticker = StockBusinessLogic._validate_stock(
+                    record.get('ticker'), current_price, record.get('market_cap')
+                )
+            except BusinessRuleException as e:
+                raise BusinessRuleException(f"Stock record {index}: {e}")
+            tickers.append(ticker)
+            rows.append((ticker, record['company_name'], current_price,
+                         record['market_cap'], record['sector'], record.get('industry')))
+
+        created = StockDAO.create_many(rows)
+
+        if created:
+            return {
+                'success': True,
+                'created': created,
+                'tickers': tickers,
+                'message': _MSG_STOCKS_CREATED.format(created)
+            }
+        else:
+            return {
+                'success': False,
+                'created': 0,
+                'message': 'Failed to create stocks - a ticker may already exist'
+            }
+
+    @staticmethod
+    def _validate_stock(ticker: str, current_price: Decimal, market_cap: int) -> str:
+        """Apply the stock creation business rules and return the normalized ticker."""
+        # Validate ticker (bound the length before normalizing oversized input)
+        ticker = (ticker or '').strip()
+        if len(ticker) > 10:
+            raise BusinessRuleException("Ticker must be 1-10 uppercase letters")
+        ticker = ticker.upper()
+        if not _TICKER_RE.fullmatch(ticker):
+            raise BusinessRuleException("Ticker must be 1-10 uppercase letters")
+
+        # Validate price
+        if current_price is None or current_price <= 0:
+            raise BusinessRuleException("Stock price must be positive")
+
+        # Validate market cap
+        if market_cap is None or market_cap <= 0:
+            raise BusinessRuleException("Market cap must be positive")
+
+        return ticker
+
     @staticmethod
     def get_stock(stock_id: int) -> Optional[Dict]:
         """Get stock by ID."""
         return StockDAO.read_by_id(stock_id)
 
+    @staticmethod
+    def peek_stock(stock_id: int) -> Optional[Dict]:
+        """Get stock by ID if it is cached in this process, without blocking on the database."""
+        return StockDAO.peek_by_id(stock_id)
+
     @staticmethod
     def get_all_stocks() -> List[Dict]:
         """Get all stocks."""
         return StockDAO.read_all()
 
+    @staticmethod
+    def get_stocks_page(after_id: int = 0, limit: int = 100) -> Tuple[List[Dict], Optional[int]]:
+        """Get one page of stocks by stock_id; returns (stocks, next after_id or None)."""
+        return StockDAO.read_page(after_id, limit)
+
     @staticmethod
     def search_stock_by_ticker(ticker: str) -> Optional[Dict]:
         """Search for a stock by ticker symbol."""
-        return StockDAO.find_by_ticker(ticker.upper())
+        # Tickers are stored uppercase; only allocate a new string when needed
+        if not ticker.isupper():
+            ticker = ticker.upper()
+        return StockDAO.find_by_ticker(ticker)
 
     @staticmethod
     def get_stocks_by_sector(sector: str) -> List[Dict]:
@@ -215,6 +412,7 @@ class StockBusinessLogic:
         - Price must be positive
         - Price change > 20% triggers warning
         """
+        new_price = to_money(new_price)
         if new_price <= 0:
             raise BusinessRuleException("Stock price must be positive")
 
@@ -223,7 +421,9 @@ class StockBusinessLogic:
             raise BusinessRuleException(f"Stock {stock_id} not found")
 
         old_price = stock['current_price']
-        price_change = abs(new_price - old_price) / old_price * 100
+        # Percent change only feeds a threshold check and a message, so float precision is enough
+        old_price_f = float(old_price)
+        price_change = abs(float(new_price) - old_price_f) / old_price_f * 100.0
 
         success = StockDAO.update(stock_id, current_price=new_price)
 
@@ -233,9 +433,9 @@ class StockBusinessLogic:
 
         return {
             'success': success,
-            'old_price': float(old_price),
-            'new_price': float(new_price),
-            'price_change_percent': float(price_change),
+            'old_price': old_price,
+            'new_price': new_price,
+            'price_change_percent': price_change,
             'warning': warning,
             'message': 'Stock price updated successfully'
         }
@@ -265,8 +465,7 @@ class PortfolioBusinessLogic:
         - User can't have duplicate portfolio names
         """
         # Verify user exists
-        user = UserDAO.read_by_id(user_id)
-        if not user:
+        if not UserDAO.exists(user_id):
             raise BusinessRuleException(f"User {user_id} not found")
 
         # Validate portfolio name
@@ -279,7 +478,7 @@ class PortfolioBusinessLogic:
             return {
                 'success': True,
                 'portfolio_id': portfolio_id,
-                'message': f'Portfolio "{portfolio_name}" created successfully'
+                'message': _MSG_PORTFOLIO_CREATED.format(portfolio_name)
             }
         else:
             return {
@@ -297,6 +496,11 @@ class PortfolioBusinessLogic:
         """Get all portfolios."""
         return PortfolioDAO.read_all()
 
+    @staticmethod
+    def get_portfolios_page(after_id: int = 0, limit: int = 100) -> Tuple[List[Dict], Optional[int]]:
+        """Get one page of portfolios by portfolio_id; returns (portfolios, next after_id or None)."""
+        return PortfolioDAO.read_page(after_id, limit)
+
     @staticmethod
     def get_user_portfolios(user_id: int) -> List[Dict]:
         """Get all portfolios for a user."""
@@ -312,7 +516,7 @@ class PortfolioBusinessLogic:
 
         return {
             'success': success,
-            'new_value': float(new_value),
+            'new_value': new_value,
             'message': 'Portfolio value updated successfully'
         }
 
@@ -344,97 +548,62 @@ class TransactionBusinessLogic:
         """
         # Validate transaction type
         transaction_type = transaction_type.upper()
-        if transaction_type not in ['BUY', 'SELL']:
+        if transaction_type not in _TXN_TYPES:
             raise BusinessRuleException("Transaction type must be BUY or SELL")
 
         # Validate quantity and price
+        price_per_share = to_money(price_per_share)
         if quantity <= 0:
             raise BusinessRuleException("Quantity must be positive")
         if price_per_share <= 0:
             raise BusinessRuleException("Price per share must be positive")
 
-        # Verify entities exist
-        user = UserDAO.read_by_id(user_id)
-        if not user:
-            raise BusinessRuleException(f"User {user_id} not found")
-
-        stock = StockDAO.read_by_id(stock_id)
-        if not stock:
-            raise BusinessRuleException(f"Stock {stock_id} not found")
-
-        portfolio = PortfolioDAO.read_by_id(portfolio_id)
-        if not portfolio:
-            raise BusinessRuleException(f"Portfolio {portfolio_id} not found")
-
-        # Verify portfolio belongs to user
-        if portfolio['user_id'] != user_id:
-            raise BusinessRuleException("Portfolio does not belong to this user")
-
-        # Calculate total
-        total_amount = quantity * price_per_share
-
-        # Business rule: Check user balance for BUY transactions
-        if transaction_type == 'BUY':
-            if user['account_balance'] < total_amount:
+        # One pinned connection serves every DAO call below
+        with DatabaseConnection.session():
+            # Verify entities exist (user, stock and portfolio in one round trip)
+            context = TransactionDAO.get_transaction_context(user_id, stock_id, portfolio_id)
+            if not context or context['user_id'] is None:
+                raise BusinessRuleException(f"User {user_id} not found")
+            if context['stock_id'] is None:
+                raise BusinessRuleException(f"Stock {stock_id} not found")
+            if context['portfolio_id'] is None:
+                raise BusinessRuleException(f"Portfolio {portfolio_id} not found")
+
+            # Verify portfolio belongs to user
+            if context['portfolio_user_id'] != user_id:
+                raise BusinessRuleException("Portfolio does not belong to this user")
+
+            # Calculate total
+            total_amount = quantity * price_per_share
+
+            # Debit or credit the balance, record the transaction and revalue the
+            # portfolio in one database transaction: all of it commits or none does.
+            # Business rule: BUY must be covered by the balance; the check and the
+            # debit happen in one conditional UPDATE so concurrent buys can't overdraw.
+            settled = TransactionDAO.create_settled(
+                user_id, stock_id, portfolio_id, transaction_type,
+                quantity, price_per_share, notes
+            )
+
+            if settled and settled['transaction_id'] is None:
                 raise BusinessRuleException(
-                    f"Insufficient funds. Need ${total_amount:.2f}, have ${user['account_balance']:.2f}"
+                    f"Insufficient funds. Need ${total_amount:.2f}, have ${context['account_balance']:.2f}"
                 )
 
-        # Create transaction
-        transaction_id = TransactionDAO.create(
-            user_id, stock_id, portfolio_id, transaction_type,
-            quantity, price_per_share, notes
-        )
-
-        if transaction_id:
-            # Update user balance
-            if transaction_type == 'BUY':
-                UserDAO.update(user_id, account_balance=user['account_balance'] - total_amount)
-            else:  # SELL
-                UserDAO.update(user_id, account_balance=user['account_balance'] + total_amount)
-
-            # Update portfolio total value
-            # Calculate portfolio value based on all transactions using current stock prices
-            portfolio_transactions = TransactionDAO.find_by_portfolio(portfolio_id)
-
-            # Track holdings: {stock_id: net_quantity}
-            holdings = {}
-            for txn in portfolio_transactions:
-                stock_id = txn['stock_id']
-                qty = txn['quantity']
-
-                if stock_id not in holdings:
-                    holdings[stock_id] = 0
-
-                if txn['transaction_type'] == 'BUY':
-                    holdings[stock_id] += qty
-                else:  # SELL
-                    holdings[stock_id] -= qty
-
-            # Calculate total value using current stock prices
-            portfolio_total = Decimal('0.00')
-            for stock_id, quantity in holdings.items():
-                if quantity > 0:  # Only count positive holdings
-                    stock_data = StockDAO.read_by_id(stock_id)
-                    if stock_data:
-                        portfolio_total += Decimal(str(quantity)) * stock_data['current_price']
-
-            # Update portfolio total value
-            PortfolioDAO.update(portfolio_id, total_value=portfolio_total)
-
-            return {
-                'success': True,
-                'transaction_id': transaction_id,
-                'total_amount': float(total_amount),
-                'new_balance': float(user['account_balance'] + (total_amount if transaction_type == 'SELL' else -total_amount)),
-                'portfolio_value': float(portfolio_total),
-                'message': f'{transaction_type} transaction created successfully'
-            }
-        else:
-            return {
-                'success': False,
-                'message': 'Failed to create transaction'
-            }
+            if settled:
+                return {
+                    'success': True,
+                    'transaction_id': settled['transaction_id'],
+                    'total_amount': total_amount,
+                    'new_balance': settled['new_balance'],
+                    'portfolio_value': settled['portfolio_value'],
+                    'message': _MSG_TXN_CREATED.format(transaction_type)
+                }
+            else:
+                return {
+                    'success': False,
+                    'message': 'Failed to create transaction'
+                }
 
     @staticmethod
     def get_transaction(transaction_id: int) -> Optional[Dict]:
@@ -446,16 +615,31 @@ class TransactionBusinessLogic:
         """Get all transactions."""
         return TransactionDAO.read_all()
 
+    @staticmethod
+    def get_transactions_page(after_id: int = 0, limit: int = 100) -> Tuple[List[Dict], Optional[int]]:
+        """Get one page of transactions by transaction_id; returns (transactions, next after_id or None)."""
+        return TransactionDAO.read_page(after_id, limit)
+
     @staticmethod
     def get_user_transactions(user_id: int) -> List[Dict]:
         """Get all transactions for a user."""
         return TransactionDAO.find_by_user(user_id)
 
+    @staticmethod
+    def iter_user_transactions(user_id: int) -> Iterator[Dict]:
+        """Stream a user's transactions without loading them all at once."""
+        return TransactionDAO.iter_by_user(user_id)
+
     @staticmethod
     def get_stock_transactions(stock_id: int) -> List[Dict]:
         """Get all transactions for a stock."""
         return TransactionDAO.find_by_stock(stock_id)
 
+    @staticmethod
+    def iter_stock_transactions(stock_id: int) -> Iterator[Dict]:
+        """Stream a stock's transactions without loading them all at once."""
+        return TransactionDAO.iter_by_stock(stock_id)
+
     @staticmethod
     def get_portfolio_transactions(portfolio_id: int) -> List[Dict]:
         """Get all transactions for a portfolio."""
@@ -488,13 +672,13 @@ class WatchlistBusinessLogic:
         - Target price must be positive if provided
         - No duplicate entries
         """
+        target_price = to_money(target_price)
         # Verify user and stock exist
-        user = UserDAO.read_by_id(user_id)
-        if not user:
+        if not UserDAO.exists(user_id):
             raise BusinessRuleException(f"User {user_id} not found")
 
-        stock = StockDAO.read_by_id(stock_id)
-        if not stock:
+        ticker = StockDAO.get_ticker(stock_id)
+        if ticker is None:
             raise BusinessRuleException(f"Stock {stock_id} not found")
 
         # Validate target price
@@ -507,7 +691,7 @@ class WatchlistBusinessLogic:
             return {
                 'success': True,
                 'watchlist_id': watchlist_id,
-                'message': f'Added {stock["ticker_symbol"]} to watchlist'
+                'message': _MSG_WATCHLIST_ADDED.format(ticker)
             }
         else:
             return {
@@ -533,6 +717,7 @@ class WatchlistBusinessLogic:
     @staticmethod
     def update_target_price(watchlist_id: int, target_price: Decimal) -> Dict:
         """Update target price for a watchlist item."""
+        target_price = to_money(target_price)
         if target_price <= 0:
             raise BusinessRuleException("Target price must be positive")
 
@@ -559,27 +744,23 @@ class WatchlistBusinessLogic:
 
         Business Rule: Alert if current price <= target price
         """
-        watchlist = WatchlistDAO.find_by_user(user_id)
-        alerts = []
-
-        for item in watchlist:
-            if item['alert_enabled'] and item['target_price']:
-                if item['current_price'] <= item['target_price']:
-                    alerts.append({
-                        'ticker': item['ticker_symbol'],
-                        'company': item['company_name'],
-                        'current_price': float(item['current_price']),
-                        'target_price': float(item['target_price']),
-                        'message': f"{item['ticker_symbol']} has reached target price!"
-                    })
-
-        return alerts
+        # The DAO applies the alert predicate in SQL and returns plain tuples
+        msg = _MSG_PRICE_ALERT.format
+        return [
+            {
+                'ticker': ticker,
+                'company': company,
+                'current_price': current_price,
+                'target_price': target_price,
+                'message': msg(ticker)
+            }
+            for ticker, company, current_price, target_price
+            in WatchlistDAO.find_triggered_alerts(user_id)
+        ]
 
 
 # Example usage and testing
 if __name__ == "__main__":
-    from data_access_layer import DatabaseConnection
-
     # Initialize database connection
     DatabaseConnection.initialize_pool(
         host='localhost',
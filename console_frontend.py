@@ -6,9 +6,13 @@ Requirements: pip install mysql-connector-python tabulate
 """
 
 import sys
+import time
+from functools import partial
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from operator import attrgetter, itemgetter
 from decimal import Decimal
-from datetime import datetime
-from tabulate import tabulate
 from data_access_layer import (
     DatabaseConnection,
     UserDAO,
@@ -18,6 +22,77 @@ from data_access_layer import (
     WatchlistDAO
 )
 
+# tabulate layout for every table; "simple" skips grid's per-cell borders
+TABLE_FMT = "simple"
+
+# tabulate bound with the options above, imported on first use
+_tabulate = None
+
+
+def _render_table(table_data, headers):
+    """Render a table with tabulate, importing it on the first table view."""
+    global _tabulate
+    if _tabulate is None:
+        from tabulate import tabulate
+        _tabulate = partial(tabulate, tablefmt=TABLE_FMT, disable_numparse=True)
+    return _tabulate(table_data, headers=headers)
+
+
+# Rows shown per page in the list views
+PAGE_SIZE = 25
+
+# Seconds the in-memory stock indexes stay fresh
+STOCK_CACHE_TTL = 60
+
+
+# Horizontal rules used throughout the console
+_LINE70_DASH = "-" * 70
+_LINE70_EQ = "=" * 70
+
+
+def _banner(title, indent):
+    """Build a view heading: a title between two rules of '='."""
+    return f"\n{_LINE70_EQ}\n{' ' * indent}{title}\n{_LINE70_EQ}\n\n"
+
+
+# Headings written in one call at the top of each view
+_BANNER_ALL_STOCKS = _banner("ALL STOCKS", 25)
+_BANNER_USER_TRANSACTIONS = _banner("USER TRANSACTIONS", 22)
+_BANNER_USER_PORTFOLIOS = _banner("USER PORTFOLIOS", 23)
+_BANNER_USER_WATCHLIST = _banner("USER WATCHLIST", 24)
+_BANNER_SEARCH_TICKER = _banner("SEARCH STOCK BY TICKER", 22)
+_BANNER_STOCKS_BY_SECTOR = _banner("STOCKS BY SECTOR", 22)
+_BANNER_ALL_USERS = _banner("ALL USERS", 27)
+_BANNER_STOCK_DETAILS = _banner("STOCK DETAILS", 24)
+_BANNER_CREATE_TRANSACTION = _banner("CREATE NEW TRANSACTION", 21)
+_BANNER_ADD_TO_WATCHLIST = _banner("ADD STOCK TO WATCHLIST", 20)
+
+# Column getters for each table view, pulling a row's cells in one C call
+_STOCK_ROW = itemgetter('stock_id', 'ticker_symbol', 'company_name_short',
+                        'current_price_fmt', 'market_cap_fmt', 'sector')
+_TXN_ROW = itemgetter('transaction_id', 'transaction_type', 'ticker_symbol', 'quantity',
+                      'price_per_share_fmt', 'total_amount_fmt', 'transaction_date_fmt',
+                      'portfolio_name_short')
+_PORTFOLIO_ROW = itemgetter('portfolio_id', 'portfolio_name', 'total_value',
+                            'is_active', 'created_at')
+_WATCHLIST_ROW = itemgetter('watchlist_id', 'ticker_symbol', 'company_name_short', 'current_price',
+                            'target_price', 'alert_enabled', 'added_date')
+_SECTOR_STOCK_ROW = attrgetter('ticker_symbol', 'company_name', 'current_price', 'industry')
+_USER_ROW = itemgetter('user_id', 'username', 'first_name', 'last_name', 'email',
+                       'account_balance_fmt', 'created_at_fmt')
+_STOCK_TXN_ROW = itemgetter('transaction_type', 'username', 'quantity', 'price_per_share',
+                            'total_amount', 'transaction_date')
+
+
+# Column headers for each table view
+_HDR_ALL_STOCKS = ("ID", "Ticker", "Company", "Price", "Market Cap", "Sector")
+_HDR_TXNS = ("ID", "Type", "Ticker", "Qty", "Price", "Total", "Date", "Portfolio")
+_HDR_PORTFOLIOS = ("ID", "Name", "Total Value", "Status", "Created")
+_HDR_WATCHLIST = ("ID", "Ticker", "Company", "Current", "Target", "Alert", "Added")
+_HDR_SECTOR_STOCKS = ("Ticker", "Company", "Price", "Industry")
+_HDR_ALL_USERS = ("ID", "Username", "Name", "Email", "Balance", "Created")
+_HDR_STOCK_TXNS = ("Type", "User", "Qty", "Price", "Total", "Date")
+
 
 class StockTrackerConsole:
     """Main console application for Stock Portfolio Tracker."""
@@ -26,23 +101,91 @@ class StockTrackerConsole:
         """Initialize the console application."""
         self.current_user_id = None
         self.running = True
+        self.stocks_by_id = {}
+        self.stocks_by_ticker = {}
+        self.stocks_by_sector = {}
+        self.sectors = []
+        self._stocks_loaded_at = None
+        self._stock_prefetch = None
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    def _pages(self, fetch_page, next_key):
+        """
+        Yield (page_number, rows) one page at a time, prompting for
+        next/previous/quit between pages.
+
+        fetch_page(key, limit) returns the page starting at key (None for the
+        first page); next_key(key, last_row) gives the key of the next page.
+        One extra row is fetched to tell whether another page exists.
+        """
+        keys = [None]
+        while True:
+            rows = list(fetch_page(keys[-1], PAGE_SIZE + 1))
+            has_more = len(rows) > PAGE_SIZE
+            del rows[PAGE_SIZE:]
+            yield len(keys), rows
+
+            if not has_more and len(keys) == 1:
+                return
+            options = []
+            if has_more:
+                options.append("[n]ext")
+            if len(keys) > 1:
+                options.append("[p]rev")
+            options.append("[q]uit")
+            choice = input("\n" + ", ".join(options) + ": ").strip().lower()
+            if choice == 'n' and has_more:
+                keys.append(next_key(keys[-1], rows[-1]))
+            elif choice == 'p' and len(keys) > 1:
+                keys.pop()
+            elif choice == 'q':
+                return
+
+    def _load_stock_cache(self):
+        """Load every stock once and index it by ID, ticker and sector."""
+        stocks_by_sector = defaultdict(list)
+        self.stocks_by_id = {}
+        self.stocks_by_ticker = {}
+        for stock in StockDAO.read_all_rows():  # ordered by ticker
+            self.stocks_by_id[stock.stock_id] = stock
+            self.stocks_by_ticker[stock.ticker_symbol] = stock
+            stocks_by_sector[stock.sector].append(stock)
+        self.stocks_by_sector = dict(stocks_by_sector)
+        self.sectors = sorted(stocks_by_sector)
+        self._stocks_loaded_at = time.monotonic()
+
+    def _ensure_stock_cache(self):
+        """Reload the stock indexes if they are missing or stale."""
+        if self._stock_prefetch is not None:
+            # Wait for (and surface any error from) the startup prefetch
+            prefetch, self._stock_prefetch = self._stock_prefetch, None
+            prefetch.result()
+        if (self._stocks_loaded_at is None
+                or time.monotonic() - self._stocks_loaded_at >= STOCK_CACHE_TTL):
+            self._load_stock_cache()
+
+    def _read_int(self, prompt):
+        """Read an integer from input, or return None if the entry isn't one."""
+        text = input(prompt).strip()
+        digits = text[1:] if text[:1] in ('-', '+') else text
+        return int(text) if digits.isdecimal() else None
 
     def clear_screen(self):
         """Clear the console screen."""
-        print("\n" * 2)
+        sys.stdout.write("\n\n\n")
 
     def display_header(self):
         """Display application header."""
-        print("=" * 70)
+        print(_LINE70_EQ)
         print(" " * 15 + "STOCK PORTFOLIO TRACKER")
         print(" " * 20 + "Console Application")
-        print("=" * 70)
+        print(_LINE70_EQ)
 
     def display_menu(self):
         """Display main menu options."""
-        print("\n" + "-" * 70)
+        print("\n" + _LINE70_DASH)
         print("MAIN MENU")
-        print("-" * 70)
+        print(_LINE70_DASH)
         print("1.  View All Stocks")
         print("2.  View User Transactions")
         print("3.  View User Portfolios")
@@ -54,92 +197,71 @@ class StockTrackerConsole:
         print("9.  Create New Transaction")
         print("10. Add Stock to Watchlist")
         print("0.  Exit")
-        print("-" * 70)
+        print(_LINE70_DASH)
 
     def view_all_stocks(self):
         """Display all stocks in a formatted table."""
         self.clear_screen()
-        print("\n" + "=" * 70)
-        print(" " * 25 + "ALL STOCKS")
-        print("=" * 70 + "\n")
+        sys.stdout.write(_BANNER_ALL_STOCKS)
 
-        stocks = StockDAO.read_all()
+        # Keyset pagination on ticker_symbol, the order the stocks are listed in
+        for page, stocks in self._pages(StockDAO.iter_all,
+                                        lambda key, row: row['ticker_symbol']):
+            if not stocks:
+                print("No stocks found in the database.")
+                return
 
-        if not stocks:
-            print("No stocks found in the database.")
-            return
+            # Name is truncated and price/market cap formatted by SQL
+            table_data = [
+                (stock_id, ticker, company, price, market_cap or "N/A", sector)
+                for stock_id, ticker, company, price, market_cap, sector
+                in map(_STOCK_ROW, stocks)
+            ]
 
-        # Prepare data for tabulation
-        headers = ["ID", "Ticker", "Company", "Price", "Market Cap", "Sector"]
-        table_data = []
-
-        for stock in stocks:
-            market_cap = f"${stock['market_cap']:,}" if stock['market_cap'] else "N/A"
-            table_data.append([
-                stock['stock_id'],
-                stock['ticker_symbol'],
-                stock['company_name'][:30],  # Truncate long names
-                f"${stock['current_price']:.2f}",
-                market_cap,
-                stock['sector']
-            ])
-
-        print(tabulate(table_data, headers=headers, tablefmt="grid"))
-        print(f"\nTotal Stocks: {len(stocks)}")
+            print(_render_table(table_data, headers=_HDR_ALL_STOCKS))
+            print(f"\nPage {page} ({len(stocks)} stocks)")
 
     def view_user_transactions(self):
         """Display transactions for a specific user."""
         self.clear_screen()
-        print("\n" + "=" * 70)
-        print(" " * 22 + "USER TRANSACTIONS")
-        print("=" * 70 + "\n")
+        sys.stdout.write(_BANNER_USER_TRANSACTIONS)
 
         # Get user ID
-        try:
-            user_id = int(input("Enter User ID (or 0 to cancel): "))
-            if user_id == 0:
-                return
-        except ValueError:
+        user_id = self._read_int("Enter User ID (or 0 to cancel): ")
+        if user_id is None:
             print("Invalid User ID. Please enter a number.")
             return
+        if user_id == 0:
+            return
 
-        # Verify user exists
-        user = UserDAO.read_by_id(user_id)
+        # Transactions come back joined with the user's details, so the
+        # separate user lookup is only needed when there are none
+        pages = self._pages(
+            lambda offset, limit: TransactionDAO.iter_by_user_detailed(user_id, limit, offset or 0),
+            lambda offset, row: (offset or 0) + PAGE_SIZE
+        )
+        page, transactions = next(pages)
+        user = transactions[0] if transactions else UserDAO.read_by_id(user_id)
         if not user:
             print(f"No user found with ID {user_id}")
             return
 
         print(f"\nTransactions for: {user['first_name']} {user['last_name']} (@{user['username']})")
-        print("-" * 70)
-
-        transactions = TransactionDAO.find_by_user(user_id)
+        print(_LINE70_DASH)
 
         if not transactions:
             print("No transactions found for this user.")
             return
 
-        # Prepare data for tabulation
-        headers = ["ID", "Type", "Ticker", "Qty", "Price", "Total", "Date", "Portfolio"]
-        table_data = []
-
-        for txn in transactions:
-            table_data.append([
-                txn['transaction_id'],
-                txn['transaction_type'],
-                txn['ticker_symbol'],
-                txn['quantity'],
-                f"${txn['price_per_share']:.2f}",
-                f"${txn['total_amount']:.2f}",
-                txn['transaction_date'].strftime('%Y-%m-%d'),
-                txn['portfolio_name'][:15]
-            ])
-
-        print("\n" + tabulate(table_data, headers=headers, tablefmt="grid"))
-        print(f"\nTotal Transactions: {len(transactions)}")
-
-        # Calculate summary
-        buy_total = sum(txn['total_amount'] for txn in transactions if txn['transaction_type'] == 'BUY')
-        sell_total = sum(txn['total_amount'] for txn in transactions if txn['transaction_type'] == 'SELL')
+        for page, transactions in chain([(page, transactions)], pages):
+            table_data = list(map(_TXN_ROW, transactions))
+
+            print("\n" + _render_table(table_data, headers=_HDR_TXNS))
+            print(f"\nPage {page} - Total Transactions: {user['txn_count']}")
+
+        # Summary totals are aggregated by the query over all pages
+        buy_total = user['buy_total']
+        sell_total = user['sell_total']
 
         print(f"\nSummary:")
         print(f"  Total Purchases: ${buy_total:.2f}")
@@ -149,239 +271,200 @@ class StockTrackerConsole:
     def view_user_portfolios(self):
         """Display portfolios for a specific user."""
         self.clear_screen()
-        print("\n" + "=" * 70)
-        print(" " * 23 + "USER PORTFOLIOS")
-        print("=" * 70 + "\n")
+        sys.stdout.write(_BANNER_USER_PORTFOLIOS)
 
         # Get user ID
-        try:
-            user_id = int(input("Enter User ID (or 0 to cancel): "))
-            if user_id == 0:
-                return
-        except ValueError:
+        user_id = self._read_int("Enter User ID (or 0 to cancel): ")
+        if user_id is None:
             print("Invalid User ID. Please enter a number.")
             return
+        if user_id == 0:
+            return
 
-        # Verify user exists
-        user = UserDAO.read_by_id(user_id)
-        if not user:
+        # One query returns the owner and their portfolios; no rows means no user
+        rows = PortfolioDAO.find_by_user_with_owner(user_id)
+        if not rows:
             print(f"No user found with ID {user_id}")
             return
 
+        user = rows[0]
         print(f"\nPortfolios for: {user['first_name']} {user['last_name']} (@{user['username']})")
         print(f"Account Balance: ${user['account_balance']:.2f}")
-        print("-" * 70)
+        print(_LINE70_DASH)
 
-        portfolios = PortfolioDAO.find_by_user(user_id)
+        portfolios = rows if user['portfolio_id'] is not None else []
 
         if not portfolios:
             print("No portfolios found for this user.")
             return
 
         # Prepare data for tabulation
-        headers = ["ID", "Name", "Total Value", "Status", "Created"]
-        table_data = []
-
-        for portfolio in portfolios:
-            status = "Active" if portfolio['is_active'] else "Inactive"
-            table_data.append([
-                portfolio['portfolio_id'],
-                portfolio['portfolio_name'],
-                f"${portfolio['total_value']:.2f}",
-                status,
-                portfolio['created_at'].strftime('%Y-%m-%d')
-            ])
-
-        print("\n" + tabulate(table_data, headers=headers, tablefmt="grid"))
+        table_data = [
+            (portfolio_id, name, f"${total_value:.2f}",
+             "Active" if is_active else "Inactive", created_at.date().isoformat())
+            for portfolio_id, name, total_value, is_active, created_at
+            in map(_PORTFOLIO_ROW, portfolios)
+        ]
+
+        print("\n" + _render_table(table_data, headers=_HDR_PORTFOLIOS))
         print(f"\nTotal Portfolios: {len(portfolios)}")
 
-        total_value = sum(p['total_value'] for p in portfolios)
-        print(f"Combined Portfolio Value: ${total_value:.2f}")
+        # Summed by the query alongside the rows
+        print(f"Combined Portfolio Value: ${portfolios[0]['combined_value']:.2f}")
 
     def view_user_watchlist(self):
         """Display watchlist for a specific user."""
         self.clear_screen()
-        print("\n" + "=" * 70)
-        print(" " * 24 + "USER WATCHLIST")
-        print("=" * 70 + "\n")
+        sys.stdout.write(_BANNER_USER_WATCHLIST)
 
         # Get user ID
-        try:
-            user_id = int(input("Enter User ID (or 0 to cancel): "))
-            if user_id == 0:
-                return
-        except ValueError:
+        user_id = self._read_int("Enter User ID (or 0 to cancel): ")
+        if user_id is None:
             print("Invalid User ID. Please enter a number.")
             return
+        if user_id == 0:
+            return
 
-        # Verify user exists
-        user = UserDAO.read_by_id(user_id)
-        if not user:
+        # One query returns the owner and their watchlist; no rows means no user
+        rows = WatchlistDAO.find_by_user_with_owner(user_id)
+        if not rows:
             print(f"No user found with ID {user_id}")
             return
 
+        user = rows[0]
         print(f"\nWatchlist for: {user['first_name']} {user['last_name']} (@{user['username']})")
-        print("-" * 70)
+        print(_LINE70_DASH)
 
-        watchlist = WatchlistDAO.find_by_user(user_id)
+        watchlist = rows if user['watchlist_id'] is not None else []
 
         if not watchlist:
             print("Watchlist is empty.")
             return
 
         # Prepare data for tabulation
-        headers = ["ID", "Ticker", "Company", "Current", "Target", "Alert", "Added"]
-        table_data = []
-
-        for item in watchlist:
-            target = f"${item['target_price']:.2f}" if item['target_price'] else "N/A"
-            alert = "Yes" if item['alert_enabled'] else "No"
-            table_data.append([
-                item['watchlist_id'],
-                item['ticker_symbol'],
-                item['company_name'][:25],
-                f"${item['current_price']:.2f}",
-                target,
-                alert,
-                item['added_date'].strftime('%Y-%m-%d')
-            ])
-
-        print("\n" + tabulate(table_data, headers=headers, tablefmt="grid"))
+        table_data = [
+            (watchlist_id, ticker, company, f"${current:.2f}",
+             f"${target:.2f}" if target else "N/A",
+             "Yes" if alert_enabled else "No", added_date.date().isoformat())
+            for watchlist_id, ticker, company, current, target, alert_enabled, added_date
+            in map(_WATCHLIST_ROW, watchlist)
+        ]
+
+        print("\n" + _render_table(table_data, headers=_HDR_WATCHLIST))
         print(f"\nTotal Stocks Watched: {len(watchlist)}")
 
     def search_stock_by_ticker(self):
         """Search for a stock by ticker symbol."""
         self.clear_screen()
-        print("\n" + "=" * 70)
-        print(" " * 22 + "SEARCH STOCK BY TICKER")
-        print("=" * 70 + "\n")
+        sys.stdout.write(_BANNER_SEARCH_TICKER)
 
         ticker = input("Enter Ticker Symbol (or press Enter to cancel): ").strip().upper()
         if not ticker:
             return
 
-        stock = StockDAO.find_by_ticker(ticker)
+        self._ensure_stock_cache()
+        stock = self.stocks_by_ticker.get(ticker)
 
         if not stock:
             print(f"\nNo stock found with ticker symbol: {ticker}")
             return
 
         print(f"\n{'Stock Details':^70}")
-        print("-" * 70)
-        print(f"Ticker Symbol:   {stock['ticker_symbol']}")
-        print(f"Company Name:    {stock['company_name']}")
-        print(f"Current Price:   ${stock['current_price']:.2f}")
-        print(f"Market Cap:      ${stock['market_cap']:,}" if stock['market_cap'] else "N/A")
-        print(f"Sector:          {stock['sector']}")
-        print(f"Industry:        {stock['industry']}" if stock['industry'] else "N/A")
-        print(f"Last Updated:    {stock['last_updated']}")
-        print("-" * 70)
+        print(_LINE70_DASH)
+        print(f"Ticker Symbol:   {stock.ticker_symbol}")
+        print(f"Company Name:    {stock.company_name}")
+        print(f"Current Price:   ${stock.current_price:.2f}")
+        print(f"Market Cap:      ${stock.market_cap:,}" if stock.market_cap else "N/A")
+        print(f"Sector:          {stock.sector}")
+        print(f"Industry:        {stock.industry}" if stock.industry else "N/A")
+        print(f"Last Updated:    {stock.last_updated}")
+        print(_LINE70_DASH)
 
     def view_stocks_by_sector(self):
         """View all stocks in a specific sector."""
         self.clear_screen()
-        print("\n" + "=" * 70)
-        print(" " * 22 + "STOCKS BY SECTOR")
-        print("=" * 70 + "\n")
+        sys.stdout.write(_BANNER_STOCKS_BY_SECTOR)
 
-        # Get all unique sectors first
-        all_stocks = StockDAO.read_all()
-        sectors = sorted(set(stock['sector'] for stock in all_stocks))
+        # Sectors and their stocks come from the in-memory indexes
+        self._ensure_stock_cache()
+        sectors = self.sectors
 
         print("Available Sectors:")
         for i, sector in enumerate(sectors, 1):
             print(f"  {i}. {sector}")
 
-        try:
-            choice = int(input(f"\nSelect sector (1-{len(sectors)}, or 0 to cancel): "))
-            if choice == 0:
-                return
-            if choice < 1 or choice > len(sectors):
-                print("Invalid selection.")
-                return
-
-            selected_sector = sectors[choice - 1]
-        except ValueError:
+        choice = self._read_int(f"\nSelect sector (1-{len(sectors)}, or 0 to cancel): ")
+        if choice is None:
             print("Invalid input. Please enter a number.")
             return
+        if choice == 0:
+            return
+        if choice < 1 or choice > len(sectors):
+            print("Invalid selection.")
+            return
+
+        selected_sector = sectors[choice - 1]
 
         print(f"\n{'Stocks in ' + selected_sector + ' Sector':^70}")
-        print("=" * 70)
+        print(_LINE70_EQ)
 
-        stocks = StockDAO.find_by_sector(selected_sector)
+        stocks = self.stocks_by_sector.get(selected_sector, [])
 
         if not stocks:
             print(f"No stocks found in {selected_sector} sector.")
             return
 
         # Prepare data for tabulation
-        headers = ["Ticker", "Company", "Price", "Industry"]
-        table_data = []
-
-        for stock in stocks:
-            table_data.append([
-                stock['ticker_symbol'],
-                stock['company_name'][:35],
-                f"${stock['current_price']:.2f}",
-                stock['industry'] if stock['industry'] else "N/A"
-            ])
-
-        print("\n" + tabulate(table_data, headers=headers, tablefmt="grid"))
+        table_data = [
+            (ticker, company[:35], f"${price:.2f}", industry if industry else "N/A")
+            for ticker, company, price, industry in map(_SECTOR_STOCK_ROW, stocks)
+        ]
+
+        print("\n" + _render_table(table_data, headers=_HDR_SECTOR_STOCKS))
         print(f"\nTotal Stocks in {selected_sector}: {len(stocks)}")
 
     def view_all_users(self):
         """Display all users."""
         self.clear_screen()
-        print("\n" + "=" * 70)
-        print(" " * 27 + "ALL USERS")
-        print("=" * 70 + "\n")
+        sys.stdout.write(_BANNER_ALL_USERS)
 
-        users = UserDAO.read_all()
+        # Keyset pagination on (created_at, user_id), newest users first
+        for page, users in self._pages(UserDAO.iter_all,
+                                       lambda key, row: (row['created_at'], row['user_id'])):
+            if not users:
+                print("No users found in the database.")
+                return
 
-        if not users:
-            print("No users found in the database.")
-            return
+            table_data = [
+                (user_id, username, f"{first_name} {last_name}", email, balance, created)
+                for user_id, username, first_name, last_name, email, balance, created
+                in map(_USER_ROW, users)
+            ]
 
-        # Prepare data for tabulation
-        headers = ["ID", "Username", "Name", "Email", "Balance", "Created"]
-        table_data = []
-
-        for user in users:
-            table_data.append([
-                user['user_id'],
-                user['username'],
-                f"{user['first_name']} {user['last_name']}",
-                user['email'],
-                f"${user['account_balance']:.2f}",
-                user['created_at'].strftime('%Y-%m-%d')
-            ])
-
-        print(tabulate(table_data, headers=headers, tablefmt="grid"))
-        print(f"\nTotal Users: {len(users)}")
+            print(_render_table(table_data, headers=_HDR_ALL_USERS))
+            print(f"\nPage {page} ({len(users)} users)")
 
     def view_stock_details(self):
         """View detailed information about a specific stock."""
         self.clear_screen()
-        print("\n" + "=" * 70)
-        print(" " * 24 + "STOCK DETAILS")
-        print("=" * 70 + "\n")
+        sys.stdout.write(_BANNER_STOCK_DETAILS)
 
-        try:
-            stock_id = int(input("Enter Stock ID (or 0 to cancel): "))
-            if stock_id == 0:
-                return
-        except ValueError:
+        stock_id = self._read_int("Enter Stock ID (or 0 to cancel): ")
+        if stock_id is None:
             print("Invalid Stock ID. Please enter a number.")
             return
+        if stock_id == 0:
+            return
 
-        stock = StockDAO.read_by_id(stock_id)
+        # The stock and its latest transactions come back in one query
+        stock = StockDAO.read_by_id_with_recent_transactions(stock_id, limit=5)
 
         if not stock:
             print(f"No stock found with ID {stock_id}")
             return
 
         print(f"\n{'Stock Information':^70}")
-        print("=" * 70)
+        print(_LINE70_EQ)
         print(f"Stock ID:        {stock['stock_id']}")
         print(f"Ticker Symbol:   {stock['ticker_symbol']}")
         print(f"Company Name:    {stock['company_name']}")
@@ -390,34 +473,26 @@ class StockTrackerConsole:
         print(f"Sector:          {stock['sector']}")
         print(f"Industry:        {stock['industry']}" if stock['industry'] else "N/A")
         print(f"Last Updated:    {stock['last_updated']}")
-        print("=" * 70)
+        print(_LINE70_EQ)
 
         # Show related transactions
-        transactions = TransactionDAO.find_by_stock(stock_id)
-        print(f"\nRecent Transactions: {len(transactions)}")
+        transactions = stock['recent_transactions']
+        print(f"\nRecent Transactions: {stock['transaction_count']}")
 
         if transactions:
-            headers = ["Type", "User", "Qty", "Price", "Total", "Date"]
-            table_data = []
+            table_data = [
+                (txn_type, username, quantity, f"${price:.2f}", f"${total:.2f}",
+                 txn_date.date().isoformat())
+                for txn_type, username, quantity, price, total, txn_date
+                in map(_STOCK_TXN_ROW, transactions)
+            ]
 
-            for txn in transactions[:5]:  # Show last 5
-                table_data.append([
-                    txn['transaction_type'],
-                    txn['username'],
-                    txn['quantity'],
-                    f"${txn['price_per_share']:.2f}",
-                    f"${txn['total_amount']:.2f}",
-                    txn['transaction_date'].strftime('%Y-%m-%d')
-                ])
-
-            print(tabulate(table_data, headers=headers, tablefmt="grid"))
+            print(_render_table(table_data, headers=_HDR_STOCK_TXNS))
 
     def create_transaction(self):
         """Create a new transaction (demo functionality)."""
         self.clear_screen()
-        print("\n" + "=" * 70)
-        print(" " * 21 + "CREATE NEW TRANSACTION")
-        print("=" * 70 + "\n")
+        sys.stdout.write(_BANNER_CREATE_TRANSACTION)
 
         try:
             user_id = int(input("Enter User ID: "))
@@ -456,9 +531,7 @@ class StockTrackerConsole:
     def add_to_watchlist(self):
         """Add a stock to user's watchlist (demo functionality)."""
         self.clear_screen()
-        print("\n" + "=" * 70)
-        print(" " * 20 + "ADD STOCK TO WATCHLIST")
-        print("=" * 70 + "\n")
+        sys.stdout.write(_BANNER_ADD_TO_WATCHLIST)
 
         try:
             user_id = int(input("Enter User ID: "))
@@ -511,6 +584,9 @@ class StockTrackerConsole:
             print("Please check your database credentials and try again.")
             return
 
+        # Build the stock indexes in the background while the user reads the menu
+        self._stock_prefetch = self._executor.submit(self._load_stock_cache)
+
         # Main application loop
         while self.running:
             self.display_menu()
@@ -539,10 +615,10 @@ class StockTrackerConsole:
                 elif choice == '10':
                     self.add_to_watchlist()
                 elif choice == '0':
-                    print("\n" + "=" * 70)
+                    print("\n" + _LINE70_EQ)
                     print(" " * 20 + "Thank you for using")
                     print(" " * 15 + "Stock Portfolio Tracker!")
-                    print("=" * 70 + "\n")
+                    print(_LINE70_EQ + "\n")
                     self.running = False
                 else:
                     print("\n✗ Invalid choice. Please select a valid option.")
@@ -557,6 +633,8 @@ class StockTrackerConsole:
                 print(f"\n✗ An error occurred: {e}")
                 input("\nPress Enter to continue...")
 
+        self._executor.shutdown(wait=False)
+
 
 def main():
     """Main entry point for the application."""
@@ -6,12 +6,148 @@ Requirements: pip install mysql-connector-python
 Alternative: pip install psycopg2 (for PostgreSQL)
 """
 
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import count
 import mysql.connector
 from mysql.connector import Error, pooling
-from typing import List, Dict, Optional, Tuple
+from mysql.connector.errors import PoolError
+from typing import List, Dict, Iterator, Optional, Tuple
 from datetime import datetime
 from decimal import Decimal
 
+# redis-py is optional and only imported by configure_shared_cache(), so
+# processes without a shared cache don't pay for loading it
+redis = None
+
+logger = logging.getLogger(__name__)
+
+# Insert statements built once at import; Decimal values are bound as-is.
+# Transactions.total_amount is a generated column, so it is never inserted.
+_INSERT_TXN_SQL = """
+    INSERT INTO Transactions
+    (user_id, stock_id, portfolio_id, transaction_type, quantity, price_per_share, notes)
+    VALUES (%s, %s, %s, %s, %s, %s, %s)
+"""
+_INSERT_WATCHLIST_SQL = """
+    INSERT INTO Watchlists (user_id, stock_id, target_price, notes, alert_enabled)
+    VALUES (%s, %s, %s, %s, %s)
+"""
+_INSERT_USER_SQL = """
+    INSERT INTO Users (username, email, password_hash, first_name, last_name, account_balance)
+    VALUES (%s, %s, %s, %s, %s, %s)
+"""
+_INSERT_STOCK_SQL = """
+    INSERT INTO Stocks (ticker_symbol, company_name, current_price, market_cap, sector, industry)
+    VALUES (%s, %s, %s, %s, %s, %s)
+"""
+
+# Explicit column lists for reads; Users never returns password_hash
+_USER_COLUMNS = "user_id, username, email, first_name, last_name, account_balance, created_at, last_login"
+_STOCK_COLUMNS = ("stock_id, ticker_symbol, company_name, current_price, market_cap, "
+                  "sector, industry, last_updated")
+_PORTFOLIO_COLUMNS = "portfolio_id, user_id, portfolio_name, description, total_value, created_at, is_active"
+_TXN_COLUMNS = ("transaction_id, user_id, stock_id, portfolio_id, transaction_type, quantity, "
+                "price_per_share, total_amount, transaction_date, notes")
+_WATCHLIST_COLUMNS = "watchlist_id, user_id, stock_id, added_date, target_price, notes, alert_enabled"
+
+# Columns each update() may set; other keyword arguments are ignored
+_USER_UPDATABLE = frozenset({'username', 'email', 'first_name', 'last_name',
+                             'account_balance', 'last_login'})
+_STOCK_UPDATABLE = frozenset({'ticker_symbol', 'company_name', 'current_price',
+                              'market_cap', 'sector', 'industry'})
+_PORTFOLIO_UPDATABLE = frozenset({'portfolio_name', 'description', 'total_value', 'is_active'})
+_TXN_UPDATABLE = frozenset({'notes'})  # Only notes should be editable
+_WATCHLIST_UPDATABLE = frozenset({'target_price', 'notes', 'alert_enabled'})
+
+# Fixed SELECTs, formatted once at import instead of on every call
+_USER_BY_ID_SQL = f"SELECT {_USER_COLUMNS} FROM Users WHERE user_id = %s"
+_ALL_USERS_SQL = f"SELECT {_USER_COLUMNS} FROM Users ORDER BY created_at DESC"
+_USER_BY_USERNAME_SQL = f"SELECT {_USER_COLUMNS} FROM Users WHERE username = %s LIMIT 1"
+_STOCK_BY_ID_SQL = f"SELECT {_STOCK_COLUMNS} FROM Stocks WHERE stock_id = %s"
+_ALL_STOCKS_SQL = f"SELECT {_STOCK_COLUMNS} FROM Stocks ORDER BY ticker_symbol"
+_STOCK_BY_TICKER_SQL = f"SELECT {_STOCK_COLUMNS} FROM Stocks WHERE ticker_symbol = %s LIMIT 1"
+_STOCKS_BY_SECTOR_SQL = f"SELECT {_STOCK_COLUMNS} FROM Stocks WHERE sector = %s ORDER BY ticker_symbol"
+_PORTFOLIO_BY_ID_SQL = f"SELECT {_PORTFOLIO_COLUMNS} FROM Portfolios WHERE portfolio_id = %s"
+_ALL_PORTFOLIOS_SQL = f"SELECT {_PORTFOLIO_COLUMNS} FROM Portfolios ORDER BY created_at DESC"
+_PORTFOLIOS_BY_USER_SQL = (f"SELECT {_PORTFOLIO_COLUMNS} FROM Portfolios WHERE user_id = %s "
+                           "ORDER BY created_at DESC")
+_TXN_BY_ID_SQL = f"SELECT {_TXN_COLUMNS} FROM Transactions WHERE transaction_id = %s"
+_ALL_TXNS_SQL = f"SELECT {_TXN_COLUMNS} FROM Transactions ORDER BY transaction_date DESC"
+_WATCHLIST_BY_ID_SQL = f"SELECT {_WATCHLIST_COLUMNS} FROM Watchlists WHERE watchlist_id = %s"
+_ALL_WATCHLISTS_SQL = f"SELECT {_WATCHLIST_COLUMNS} FROM Watchlists ORDER BY added_date DESC"
+# Market value of a portfolio: each stock's net quantity (BUYs minus SELLs,
+# positive holdings only) at its current price, summed in the database
+_PORTFOLIO_VALUE_SQL = """
+    SELECT COALESCE(SUM(h.net_quantity * s.current_price), 0)
+    FROM (SELECT stock_id,
+                 SUM(IF(transaction_type = 'BUY', quantity, -quantity)) AS net_quantity
+          FROM Transactions
+          WHERE portfolio_id = %s
+          GROUP BY stock_id
+          HAVING net_quantity > 0) h
+    JOIN Stocks s ON s.stock_id = h.stock_id
+"""
+_REVALUE_PORTFOLIO_SQL = f"UPDATE Portfolios SET total_value = ({_PORTFOLIO_VALUE_SQL}) WHERE portfolio_id = %s"
+# A BUY's debit only applies if the balance covers it, so concurrent buys can't overdraw
+_DEBIT_USER_SQL = """
+    UPDATE Users SET account_balance = account_balance - %s
+    WHERE user_id = %s AND account_balance >= %s
+"""
+_CREDIT_USER_SQL = "UPDATE Users SET account_balance = account_balance + %s WHERE user_id = %s"
+_USER_LISTING_SQL = f"""
+    SELECT {_USER_COLUMNS},
+           CONCAT('$', u.account_balance) AS account_balance_fmt,
+           CAST(DATE(u.created_at) AS CHAR) AS created_at_fmt
+    FROM Users u
+"""
+_STOCK_WITH_RECENT_TXNS_SQL = f"""
+    SELECT {_STOCK_COLUMNS},
+           (SELECT COUNT(*) FROM Transactions t
+            WHERE t.stock_id = s.stock_id) AS transaction_count,
+           (SELECT JSON_ARRAYAGG(JSON_OBJECT(
+                       'transaction_type', r.transaction_type,
+                       'username', r.username,
+                       'quantity', r.quantity,
+                       'price_per_share', r.price_per_share,
+                       'total_amount', r.total_amount,
+                       'transaction_date', r.transaction_date))
+            FROM (SELECT t.transaction_type, u.username, t.quantity,
+                         t.price_per_share, t.total_amount, t.transaction_date
+                  FROM Transactions t
+                  JOIN Users u ON t.user_id = u.user_id
+                  WHERE t.stock_id = %s
+                  ORDER BY t.transaction_date DESC
+                  LIMIT %s) r) AS recent_transactions
+    FROM Stocks s
+    WHERE s.stock_id = %s
+"""
+
+# Rows per executemany() call; the connector folds each call into one
+# multi-row INSERT, so this keeps statements under max_allowed_packet
+INSERT_BATCH_SIZE = 1000
+
+# Connections held longer than this are reported, to help spot leaks and slow queries
+SLOW_CONNECTION_MS = 500
+
+# Default pool size. Pools are filled at startup and each worker opens a write
+# and a read pool, so this stays small; raise it with DB_POOL_SIZE (up to the
+# connector's maximum of 32) when max_connections allows
+DEFAULT_POOL_SIZE = 10
+# How long get_connection() waits for a free connection before giving up,
+# and the wait above which a checkout is reported as a sign of pool pressure
+POOL_WAIT_TIMEOUT = 5
+POOL_WAIT_WARN_MS = 100
+# Seconds an unreachable read replica is skipped before it is tried again
+REPLICA_RETRY_SECONDS = 30
+
 
 class DatabaseConnection:
     """
@@ -19,32 +155,564 @@ class DatabaseConnection:
     Handles database connections efficiently.
     """
     _connection_pool = None
+    _read_pool = None
+    _replica_pools = []
+    _replica_down_until = []
+    _replica_counter = count()
+    _local = threading.local()
+    _in_use = 0
+    _exhausted_waits = 0
+    _metrics_lock = threading.Lock()
+
+    @staticmethod
+    def _create_pool(pool_name, host, database, user, password, pool_size,
+                     autocommit=False):
+        """
+        Create one connection pool.
+
+        Sessions are not reset on checkout (the DAO keeps no session state),
+        which saves a round trip per query; _db_cursor ends any open
+        transaction before a connection goes back instead.
+
+        Read pools use autocommit: a lone SELECT then runs as its own
+        statement, so no transaction is opened and none has to be rolled
+        back when the connection is returned.
+        """
+        return pooling.MySQLConnectionPool(
+            pool_name=pool_name,
+            pool_size=pool_size,
+            pool_reset_session=False,
+            host=host,
+            database=database,
+            user=user,
+            password=password,
+            autocommit=autocommit,
+            connection_timeout=5
+        )
 
     @classmethod
     def initialize_pool(cls, host='localhost', database='stock_tracker',
-                       user='root', password='', pool_size=5):
-        """Initialize the connection pool."""
-        try:
-            cls._connection_pool = pooling.MySQLConnectionPool(
-                pool_name="stock_tracker_pool",
-                pool_size=pool_size,
-                host=host,
-                database=database,
-                user=user,
-                password=password,
-                autocommit=False
-            )
-            print(f"✓ Connection pool initialized successfully")
-        except Error as e:
-            print(f"✗ Error initializing connection pool: {e}")
+                       user='root', password='', pool_size=DEFAULT_POOL_SIZE):
+        """
+        Initialize the primary's connection pools: one for writes and one
+        (autocommit) for read-only queries, each of pool_size connections.
+
+        A pool opens all its connections up front, one after another, so the
+        two pools are filled concurrently to halve worker start-up time.
+        """
+        try:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                read_pool = executor.submit(cls._create_pool, "stock_tracker_read_pool", host,
+                                            database, user, password, pool_size, autocommit=True)
+                cls._connection_pool = cls._create_pool("stock_tracker_pool", host, database,
+                                                        user, password, pool_size)
+                cls._read_pool = read_pool.result()
+            logger.info("Connection pool initialized successfully")
+        except Error as e:
+            logger.error("Error initializing connection pool: %s", e)
             raise
 
     @classmethod
-    def get_connection(cls):
-        """Get a connection from the pool."""
-        if cls._connection_pool is None:
+    def initialize_pools(cls, primary: Dict, replicas: List[Dict] = ()):
+        """
+        Initialize the primary pool plus one pool per read replica.
+
+        Each dict takes initialize_pool()'s keyword arguments. Read-only DAO
+        queries are spread over the replicas; replicas lag the primary, so a
+        read may briefly miss a write made just before it (see primary_reads()).
+        Replica pools are filled concurrently with the primary's.
+        """
+        replicas = [dict(replica) for replica in replicas]
+        pools = []
+        with ThreadPoolExecutor(max_workers=max(len(replicas), 1)) as executor:
+            futures = []
+            for index, replica in enumerate(replicas):
+                replica.setdefault('pool_size', DEFAULT_POOL_SIZE)
+                futures.append(executor.submit(cls._create_pool, f"stock_tracker_replica_{index}",
+                                               autocommit=True, **replica))
+            cls.initialize_pool(**primary)
+            for replica, future in zip(replicas, futures):
+                try:
+                    pools.append(future.result())
+                except Error as e:
+                    logger.error("Error initializing replica pool %s: %s", replica.get('host'), e)
+        cls._replica_pools = pools
+        cls._replica_down_until = [0.0] * len(pools)
+        logger.info("%s read replica pool(s) initialized", len(pools))
+
+    @classmethod
+    @contextmanager
+    def primary_reads(cls):
+        """Send this thread's reads to the primary, for read-your-writes consistency."""
+        previous = getattr(cls._local, 'primary_reads', False)
+        cls._local.primary_reads = True
+        try:
+            yield
+        finally:
+            cls._local.primary_reads = previous
+
+    @classmethod
+    @contextmanager
+    def session(cls):
+        """
+        Pin one primary connection to this thread for the block.
+
+        DAO calls inside reuse it instead of each checking a connection out
+        (the pool pings every connection it hands out), and reads see the
+        block's own writes. Each DAO call still commits its own work, so
+        writes that must commit together belong in one DAO call (see
+        TransactionDAO.create_settled). Don't start another DAO call while
+        iterating a streamed result inside.
+        """
+        if getattr(cls._local, 'conn', None) is not None:
+            yield  # already inside a session
+            return
+        conn = cls.get_connection()
+        cls._local.conn = conn
+        try:
+            yield
+        finally:
+            cls._local.conn = None
+            try:
+                if conn.in_transaction:
+                    conn.rollback()
+            finally:
+                cls.release_connection(conn)
+
+    @classmethod
+    def get_connection(cls, timeout: float = POOL_WAIT_TIMEOUT):
+        """Get a connection from the primary's write pool."""
+        return cls._checkout(cls._connection_pool, timeout)
+
+    @classmethod
+    def _checkout(cls, pool, timeout: float = POOL_WAIT_TIMEOUT):
+        """
+        Get a connection from pool.
+
+        If the pool is exhausted, keep retrying for up to timeout seconds
+        before letting the PoolError through.
+        """
+        if pool is None:
             raise Exception("Connection pool not initialized. Call initialize_pool() first.")
-        return cls._connection_pool.get_connection()
+        started = time.monotonic()
+        while True:
+            try:
+                conn = pool.get_connection()
+                break
+            except PoolError:
+                if time.monotonic() - started >= timeout:
+                    raise
+                time.sleep(0.01)
+        waited_ms = (time.monotonic() - started) * 1000
+        with cls._metrics_lock:
+            cls._in_use += 1
+            if waited_ms > POOL_WAIT_WARN_MS:
+                cls._exhausted_waits += 1
+        if waited_ms > POOL_WAIT_WARN_MS:
+            logger.warning("Waited %.0f ms for a pooled connection", waited_ms)
+        return conn
+
+    @classmethod
+    def get_read_connection(cls):
+        """
+        Get a connection for a read-only query.
+
+        Replicas are used round-robin; one that fails to connect is skipped
+        for REPLICA_RETRY_SECONDS. Falls back to the primary's read pool when
+        there are no usable replicas or inside primary_reads(). Read
+        connections are in autocommit mode.
+        """
+        if cls._replica_pools and not getattr(cls._local, 'primary_reads', False):
+            for _ in range(len(cls._replica_pools)):
+                index = next(cls._replica_counter) % len(cls._replica_pools)
+                if cls._replica_down_until[index] > time.monotonic():
+                    continue
+                try:
+                    conn = cls._replica_pools[index].get_connection()
+                except PoolError:
+                    continue  # busy, not broken
+                except Error as e:
+                    logger.warning("Read replica %s unavailable, skipping it for %ss: %s",
+                                   index, REPLICA_RETRY_SECONDS, e)
+                    cls._replica_down_until[index] = time.monotonic() + REPLICA_RETRY_SECONDS
+                    continue
+                with cls._metrics_lock:
+                    cls._in_use += 1
+                return conn
+        return cls._checkout(cls._read_pool)
+
+    @classmethod
+    def release_connection(cls, conn):
+        """Return a connection obtained from get_connection() or get_read_connection() to its pool."""
+        try:
+            conn.close()
+        finally:
+            with cls._metrics_lock:
+                cls._in_use -= 1
+
+    @classmethod
+    def pool_metrics(cls) -> Dict:
+        """Pool occupancy for monitoring (all pools combined), slow checkouts."""
+        size = sum(pool.pool_size for pool in (cls._connection_pool, cls._read_pool) if pool)
+        size += sum(pool.pool_size for pool in cls._replica_pools)
+        with cls._metrics_lock:
+            return {'pool_size': size, 'replicas': len(cls._replica_pools),
+                    'in_use': cls._in_use,
+                    'idle': max(size - cls._in_use, 0),
+                    'slow_checkouts': cls._exhausted_waits}
+
+    @classmethod
+    def stream(cls, query: str, params: Tuple = ()) -> Iterator[Dict]:
+        """
+        Yield result rows one at a time from an unbuffered cursor.
+
+        The connection is held until the generator is exhausted or closed.
+        With no params the SQL is sent as-is, skipping the connector's
+        placeholder substitution pass.
+        """
+        with _db_cursor(dictionary=True, buffered=False, readonly=True) as (conn, cursor):
+            cursor.execute(query, params or None)
+            yield from cursor
+
+
+@contextmanager
+def _db_cursor(dictionary: bool = False, buffered: Optional[bool] = None,
+               readonly: bool = False):
+    """
+    Check out a pooled connection and cursor, yielding (conn, cursor).
+
+    readonly=True marks a SELECT-only block, which may run on a read replica.
+    Inside DatabaseConnection.session() the session's connection is used.
+
+    Uncommitted work is rolled back if the block raises, and both the cursor
+    and the connection are always returned, so a failing query cannot leak
+    a pool slot.
+
+    Any transaction still open at the end is rolled back, since the pool
+    does not reset sessions; read connections are in autocommit mode, so
+    readonly blocks normally have none to end.
+
+    Cursors are plain (not prepared): each checkout gets a new cursor, so a
+    prepared statement would be re-prepared every call, and tracking them
+    per pooled connection would have to respect the server's statement cap.
+    Hot single-row reads are served from the row cache instead.
+    """
+    pinned = getattr(DatabaseConnection._local, 'conn', None)
+    if pinned is not None:
+        conn = pinned
+    elif readonly:
+        conn = DatabaseConnection.get_read_connection()
+    else:
+        conn = DatabaseConnection.get_connection()
+    started = time.monotonic()
+    try:
+        cursor = conn.cursor(dictionary=dictionary, buffered=buffered)
+        try:
+            yield conn, cursor
+        except Error:
+            conn.rollback()
+            raise
+        finally:
+            if conn.unread_result:
+                conn.consume_results()
+            cursor.close()
+            if conn.in_transaction:
+                conn.rollback()
+    finally:
+        if pinned is None:
+            DatabaseConnection.release_connection(conn)
+            held_ms = (time.monotonic() - started) * 1000
+            if held_ms > SLOW_CONNECTION_MS:
+                logger.warning("Connection held for %.0f ms", held_ms)
+
+
+@dataclass(slots=True, frozen=True)
+class StockRow:
+    """A Stocks row as a fixed-layout object; fields follow _STOCK_COLUMNS."""
+    stock_id: int
+    ticker_symbol: str
+    company_name: str
+    current_price: Decimal
+    market_cap: Optional[int]
+    sector: str
+    industry: Optional[str]
+    last_updated: datetime
+
+
+def _encode_value(value):
+    """json default hook: tag Decimal and datetime so rows round-trip exactly."""
+    if isinstance(value, Decimal):
+        return {'__decimal__': str(value)}
+    if isinstance(value, datetime):
+        return {'__datetime__': value.isoformat()}
+    raise TypeError(f"Cannot cache value of type {type(value).__name__}")
+
+
+def _decode_value(obj: Dict):
+    """json object hook reversing _encode_value."""
+    if '__decimal__' in obj:
+        return Decimal(obj['__decimal__'])
+    if '__datetime__' in obj:
+        return datetime.fromisoformat(obj['__datetime__'])
+    return obj
+
+
+class SharedCache:
+    """
+    Redis tier behind a RowCache, shared by every API worker.
+
+    Keys follow "v1:entity:generation:field:value". A write bumps the
+    entity's generation counter, which orphans all of its cached rows in one
+    command; they age out by TTL. A fill uses the generation seen before the
+    database read, so a row read before a concurrent write is never served
+    after it. Redis failures are logged and treated as misses.
+    """
+
+    # Reads the generation and the row in one round trip
+    _GET_SCRIPT = """
+        local gen = redis.call('GET', KEYS[1]) or '0'
+        return {gen, redis.call('GET', ARGV[1] .. gen .. ':' .. ARGV[2])}
+    """
+
+    def __init__(self, client, entity: str, ttl: int):
+        self.client = client
+        self.ttl = ttl
+        self._prefix = f"v1:{entity}:"
+        self._gen_key = f"v1:{entity}:gen"
+        self._get = client.register_script(self._GET_SCRIPT)
+
+    def get(self, key: str) -> Tuple[Optional[str], Optional[Dict]]:
+        """Return (generation, row); row is None on a miss, both are None if Redis is down."""
+        try:
+            gen, raw = self._get(keys=[self._gen_key], args=[self._prefix, key])
+        except redis.RedisError as e:
+            logger.warning("Shared cache unavailable: %s", e)
+            return None, None
+        gen = gen.decode() if isinstance(gen, bytes) else str(gen)
+        return gen, json.loads(raw, object_hook=_decode_value) if raw else None
+
+    def generation(self) -> Optional[str]:
+        """The entity's current generation, or None if Redis is down."""
+        try:
+            gen = self.client.get(self._gen_key)
+        except redis.RedisError as e:
+            logger.warning("Shared cache unavailable: %s", e)
+            return None
+        return gen.decode() if gen is not None else '0'
+
+    def put(self, gen: str, key: str, row: Dict):
+        """Store a row under the generation observed before it was read."""
+        try:
+            self.client.set(f"{self._prefix}{gen}:{key}",
+                            json.dumps(row, default=_encode_value), ex=self.ttl)
+        except redis.RedisError as e:
+            logger.warning("Shared cache unavailable: %s", e)
+
+    def lock(self, gen: str, key: str) -> bool:
+        """Claim the right to fill key (single-flight); False if another worker holds it."""
+        try:
+            return bool(self.client.set(f"{self._prefix}{gen}:{key}:lock", 1, nx=True, ex=2))
+        except redis.RedisError:
+            return True
+
+    def unlock(self, gen: str, key: str):
+        """Release a fill claim."""
+        try:
+            self.client.delete(f"{self._prefix}{gen}:{key}:lock")
+        except redis.RedisError:
+            pass
+
+    def invalidate(self):
+        """Orphan every cached row for this entity."""
+        try:
+            self.client.incr(self._gen_key)
+        except redis.RedisError as e:
+            logger.warning("Shared cache invalidation failed: %s", e)
+
+
+def _copy_rows(value):
+    """Copy a cached row, or list of rows, so callers can't mutate the cache."""
+    if isinstance(value, list):
+        return [dict(row) for row in value]
+    return dict(value)
+
+
+class RowCache:
+    """
+    Thread-safe LRU cache with a TTL for single-row reads (and a few
+    small listings).
+
+    Keys follow an "entity:field:value" scheme. Rows are stored as-is and
+    handed out as copies, so callers may mutate what they get back.
+    An optional SharedCache (see configure_shared_cache) backs local misses;
+    local rows then carry the shared generation they were cached under, and
+    only count as hits while it is current.
+    """
+
+    def __init__(self, maxsize=4096, ttl=60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.shared = None
+        self._rows = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, gen: Optional[str] = None):
+        """
+        Return a copy of the cached row(s), or None on a miss, an expired
+        entry, or one cached under a generation other than gen.
+        """
+        with self._lock:
+            entry = self._rows.get(key)
+            if entry is None or time.monotonic() - entry[0] >= self.ttl or entry[2] != gen:
+                if entry is not None:
+                    del self._rows[key]
+                return None
+            self._rows.move_to_end(key)
+            return _copy_rows(entry[1])
+
+    def put(self, key: str, row, gen: Optional[str] = None):
+        """Cache a row (or list of rows), evicting the least recently used entry when full."""
+        with self._lock:
+            self._rows[key] = (time.monotonic(), row, gen)
+            self._rows.move_to_end(key)
+            if len(self._rows) > self.maxsize:
+                self._rows.popitem(last=False)
+
+    def clear(self):
+        """Drop every cached row, here and in the shared tier."""
+        with self._lock:
+            self._rows.clear()
+        if self.shared:
+            self.shared.invalidate()
+
+
+# Writes to a table clear its whole cache: a user row is keyed by both id and
+# username, and writes are rare next to reads
+_user_cache = RowCache()
+_stock_cache = RowCache()
+
+
+# Shared-tier TTLs follow volatility: prices move minute to minute, while user
+# rows change only through writes, which invalidate them anyway
+SHARED_STOCK_TTL = 60
+SHARED_USER_TTL = 3600
+# Polls (and seconds between them) while another worker fills a missed key
+SHARED_FILL_WAITS = 5
+SHARED_FILL_POLL = 0.02
+
+
+def configure_shared_cache(url: str):
+    """Back the user and stock row caches with Redis at url (requires redis-py)."""
+    global redis
+    try:
+        import redis
+    except ImportError:
+        raise RuntimeError("Shared cache requires the redis package: pip install redis")
+    client = redis.Redis.from_url(url, socket_timeout=0.5)
+    _user_cache.shared = SharedCache(client, "user", SHARED_USER_TTL)
+    _stock_cache.shared = SharedCache(client, "stock", SHARED_STOCK_TTL)
+    logger.info("Shared row cache enabled")
+
+
+def _cached_fetch(cache: RowCache, key: str, query: str, params: Tuple,
+                  label: str, many: bool = False):
+    """
+    Serve a single-row read from cache, falling back to the database.
+
+    The row is read from an unbuffered cursor; query should match at most
+    one row (primary or unique key, or LIMIT 1). Misses read the primary so
+    a lagging replica can't repopulate the cache with a row just changed.
+    With many=True the whole result list is cached instead (and [] is
+    returned on error rather than None).
+    """
+    shared, gen, locked = cache.shared, None, False
+    if shared:
+        # Another worker's write bumps the generation, retiring local rows too
+        gen = shared.generation()
+    row = cache.get(key, gen)
+    if row is not None:
+        return row
+    if shared:
+        gen, row = shared.get(key)
+        # Another worker is already reading this row: give it a moment
+        if row is None and gen is not None and not (locked := shared.lock(gen, key)):
+            for _ in range(SHARED_FILL_WAITS):
+                time.sleep(SHARED_FILL_POLL)
+                gen, row = shared.get(key)
+                if row is not None or gen is None:
+                    break
+        if row is not None:
+            cache.put(key, row, gen)
+            return _copy_rows(row)
+    try:
+        with DatabaseConnection.primary_reads(), \
+                _db_cursor(dictionary=True, buffered=False, readonly=True) as (conn, cursor):
+            cursor.execute(query, params)
+            row = cursor.fetchall() if many else cursor.fetchone()
+        if row is None:
+            return None
+        cache.put(key, row, gen)
+        if gen is not None:
+            shared.put(gen, key, row)
+        return _copy_rows(row)
+    except Error as e:
+        logger.error("Error %s: %s", label, e)
+        return [] if many else None
+    finally:
+        if locked:
+            shared.unlock(gen, key)
+
+
+@lru_cache(maxsize=64)
+def _update_sql(table: str, key: str, fields: Tuple[str, ...]) -> str:
+    """
+    Build the UPDATE statement for a sorted tuple of column names.
+
+    Cached so each field combination yields the same SQL string every time.
+    """
+    set_clause = ", ".join(f"{field} = %s" for field in fields)
+    return f"UPDATE {table} SET {set_clause} WHERE {key} = %s"
+
+
+@lru_cache(maxsize=16)
+def _page_sql(table: str, columns: str, key: str) -> str:
+    """Build (once per table) the keyset page query used by _read_page."""
+    return f"SELECT {columns} FROM {table} WHERE {key} > %s ORDER BY {key} LIMIT %s"
+
+
+def _read_page(table: str, columns: str, key: str, after_id: int, limit: int,
+               label: str) -> Tuple[List[Dict], Optional[int]]:
+    """
+    Keyset-paginate a table by its integer primary key.
+    Returns: (rows, after_id for the next page, or None after the last page)
+    """
+    query = _page_sql(table, columns, key)
+    try:
+        with _db_cursor(dictionary=True, readonly=True) as (conn, cursor):
+            cursor.execute(query, (after_id, limit))
+            rows = cursor.fetchall()
+    except Error as e:
+        logger.error("Error %s: %s", label, e)
+        return [], None
+    return rows, (rows[-1][key] if len(rows) == limit else None)
+
+
+def _insert_many(query: str, rows: List[Tuple], label: str) -> int:
+    """
+    Insert rows with batched executemany() calls in a single transaction.
+    Returns: number of rows inserted (0 if the batch was rolled back)
+    """
+    try:
+        with _db_cursor() as (conn, cursor):
+            created = 0
+            for start in range(0, len(rows), INSERT_BATCH_SIZE):
+                cursor.executemany(query, rows[start:start + INSERT_BATCH_SIZE])
+                created += cursor.rowcount
+            conn.commit()
+        return created
+    except Error as e:
+        logger.error("Error %s: %s", label, e)
+        return 0
 
 
 class UserDAO:
@@ -57,94 +725,149 @@ class UserDAO:
         Create a new user.
         Returns: user_id if successful, None otherwise
         """
-        query = """
-            INSERT INTO Users (username, email, password_hash, first_name, last_name, account_balance)
-            VALUES (%s, %s, %s, %s, %s, %s)
-        """
         try:
-            conn = DatabaseConnection.get_connection()
-            cursor = conn.cursor()
-            cursor.execute(query, (username, email, password_hash, first_name, last_name, account_balance))
-            conn.commit()
-            user_id = cursor.lastrowid
-            cursor.close()
-            conn.close()
-            print(f"✓ User created successfully with ID: {user_id}")
+            with _db_cursor() as (conn, cursor):
+                cursor.execute(_INSERT_USER_SQL, (username, email, password_hash, first_name, last_name, account_balance))
+                conn.commit()
+                user_id = cursor.lastrowid
+            logger.debug("User created successfully with ID: %s", user_id)
             return user_id
         except Error as e:
-            print(f"✗ Error creating user: {e}")
-            if conn:
-                conn.rollback()
+            logger.error("Error creating user: %s", e)
             return None
 
     @staticmethod
-    def read_by_id(user_id: int) -> Optional[Dict]:
-        """Read a user by ID."""
-        query = "SELECT * FROM Users WHERE user_id = %s"
+    def create_many(users: List[Tuple]) -> List[int]:
+        """
+        Create many users in a single transaction.
+        users: (username, email, password_hash, first_name, last_name, account_balance) tuples
+        Returns: the new user_ids in order ([] if the batch was rolled back)
+        """
         try:
-            conn = DatabaseConnection.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute(query, (user_id,))
-            user = cursor.fetchone()
-            cursor.close()
-            conn.close()
-            return user
+            with _db_cursor() as (conn, cursor):
+                # One execute per row so each new ID is known; executemany's
+                # multi-row INSERT only reports the first
+                user_ids = []
+                for user in users:
+                    cursor.execute(_INSERT_USER_SQL, user)
+                    user_ids.append(cursor.lastrowid)
+                conn.commit()
+            logger.debug("%s users created successfully", len(user_ids))
+            return user_ids
         except Error as e:
-            print(f"✗ Error reading user: {e}")
+            logger.error("Error creating users: %s", e)
+            return []
+
+    @staticmethod
+    def read_by_id(user_id: int) -> Optional[Dict]:
+        """Read a user by ID (served from the row cache when fresh)."""
+        query = _USER_BY_ID_SQL
+        return _cached_fetch(_user_cache, f"user:id:{user_id}", query, (user_id,),
+                             "reading user")
+
+    @staticmethod
+    def peek_by_id(user_id: int) -> Optional[Dict]:
+        """
+        Return the user only if this process has it cached; never touches the
+        database. With a shared cache, local rows can't be trusted without a
+        generation check, so this always misses.
+        """
+        if _user_cache.shared:
             return None
+        return _user_cache.get(f"user:id:{user_id}")
+
+    @staticmethod
+    def exists(user_id: int) -> bool:
+        """Check whether a user exists without fetching the row."""
+        query = "SELECT 1 FROM Users WHERE user_id = %s"
+        try:
+            with _db_cursor(readonly=True) as (conn, cursor):
+                cursor.execute(query, (user_id,))
+                return cursor.fetchone() is not None
+        except Error as e:
+            logger.error("Error checking user: %s", e)
+            return False
 
     @staticmethod
     def read_all() -> List[Dict]:
         """Read all users."""
-        query = "SELECT * FROM Users ORDER BY created_at DESC"
+        query = _ALL_USERS_SQL
         try:
-            conn = DatabaseConnection.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute(query)
-            users = cursor.fetchall()
-            cursor.close()
-            conn.close()
-            return users
+            with _db_cursor(dictionary=True, readonly=True) as (conn, cursor):
+                cursor.execute(query)
+                return cursor.fetchall()
         except Error as e:
-            print(f"✗ Error reading users: {e}")
+            logger.error("Error reading users: %s", e)
             return []
 
+    @staticmethod
+    def read_page(after_id: int = 0, limit: int = 100) -> Tuple[List[Dict], Optional[int]]:
+        """
+        Read up to limit users with user_id > after_id, in user_id order.
+        Returns: (rows, after_id for the next page, or None after the last page)
+        """
+        return _read_page("Users", _USER_COLUMNS, "user_id", after_id, limit, "reading users")
+
+    @staticmethod
+    def iter_all(after: Optional[Tuple[datetime, int]] = None,
+                 limit: Optional[int] = None) -> Iterator[Dict]:
+        """
+        Stream users without loading the full result set.
+
+        For keyset pagination pass the (created_at, user_id) of the last row
+        already shown as `after`, plus a page `limit`. Rows also carry
+        display-ready *_fmt columns formatted by MySQL.
+        """
+        query = _USER_LISTING_SQL
+        params = ()
+        if after is not None:
+            query += " WHERE (u.created_at, u.user_id) < (%s, %s)"
+            params = tuple(after)
+        query += " ORDER BY u.created_at DESC, u.user_id DESC"
+        if limit is not None:
+            query += " LIMIT %s"
+            params += (limit,)
+        try:
+            yield from DatabaseConnection.stream(query, params)
+        except Error as e:
+            logger.error("Error reading users: %s", e)
+
+    @staticmethod
+    def read_all_public() -> List[Dict]:
+        """Read all users without the password_hash column (same as read_all)."""
+        return UserDAO.read_all()
+
     @staticmethod
     def update(user_id: int, **kwargs) -> bool:
         """
         Update user information.
         kwargs can include: username, email, first_name, last_name, account_balance
         """
-        allowed_fields = ['username', 'email', 'first_name', 'last_name', 'account_balance', 'last_login']
-        update_fields = {k: v for k, v in kwargs.items() if k in allowed_fields}
+        update_fields = {k: v for k, v in kwargs.items() if k in _USER_UPDATABLE}
 
         if not update_fields:
-            print("✗ No valid fields to update")
+            logger.warning("No valid fields to update")
             return False
 
-        set_clause = ", ".join([f"{field} = %s" for field in update_fields.keys()])
-        query = f"UPDATE Users SET {set_clause} WHERE user_id = %s"
-        values = list(update_fields.values()) + [user_id]
+        fields = tuple(sorted(update_fields))
+        query = _update_sql("Users", "user_id", fields)
+        values = [update_fields[field] for field in fields] + [user_id]
 
         try:
-            conn = DatabaseConnection.get_connection()
-            cursor = conn.cursor()
-            cursor.execute(query, values)
-            conn.commit()
-            affected_rows = cursor.rowcount
-            cursor.close()
-            conn.close()
+            with _db_cursor() as (conn, cursor):
+                cursor.execute(query, values)
+                conn.commit()
+                affected_rows = cursor.rowcount
+            _user_cache.clear()
 
             if affected_rows > 0:
-                print(f"✓ User {user_id} updated successfully")
+                logger.debug("User %s updated successfully", user_id)
                 return True
             else:
-                print(f"✗ No user found with ID {user_id}")
+                logger.info("No user found with ID %s", user_id)
                 return False
         except Error as e:
-            print(f"✗ Error updating user: {e}")
-            if conn:
-                conn.rollback()
+            logger.error("Error updating user: %s", e)
             return False
 
     @staticmethod
@@ -152,41 +875,29 @@ class UserDAO:
         """Delete a user by ID (cascades to related records)."""
         query = "DELETE FROM Users WHERE user_id = %s"
         try:
-            conn = DatabaseConnection.get_connection()
-            cursor = conn.cursor()
-            cursor.execute(query, (user_id,))
-            conn.commit()
-            affected_rows = cursor.rowcount
-            cursor.close()
-            conn.close()
+            with _db_cursor() as (conn, cursor):
+                cursor.execute(query, (user_id,))
+                conn.commit()
+                affected_rows = cursor.rowcount
+            _user_cache.clear()
 
             if affected_rows > 0:
-                print(f"✓ User {user_id} deleted successfully")
+                logger.debug("User %s deleted successfully", user_id)
                 return True
             else:
-                print(f"✗ No user found with ID {user_id}")
+                logger.info("No user found with ID %s", user_id)
                 return False
         except Error as e:
-            print(f"✗ Error deleting user: {e}")
-            if conn:
-                conn.rollback()
+            logger.error("Error deleting user: %s", e)
             return False
 
     @staticmethod
     def find_by_username(username: str) -> Optional[Dict]:
-        """Find a user by username."""
-        query = "SELECT * FROM Users WHERE username = %s"
-        try:
-            conn = DatabaseConnection.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute(query, (username,))
-            user = cursor.fetchone()
-            cursor.close()
-            conn.close()
-            return user
-        except Error as e:
-            print(f"✗ Error finding user: {e}")
-            return None
+        """Find a user by username (served from the row cache when fresh)."""
+        # username is UNIQUE, so this is a single index probe
+        query = _USER_BY_USERNAME_SQL
+        return _cached_fetch(_user_cache, f"user:username:{username}", query, (username,),
+                             "finding user")
 
 
 class StockDAO:
@@ -196,97 +907,180 @@ class StockDAO:
     def create(ticker_symbol: str, company_name: str, current_price: Decimal,
                market_cap: int, sector: str, industry: str = None) -> Optional[int]:
         """Create a new stock."""
-        query = """
-            INSERT INTO Stocks (ticker_symbol, company_name, current_price, market_cap, sector, industry)
-            VALUES (%s, %s, %s, %s, %s, %s)
-        """
         try:
-            conn = DatabaseConnection.get_connection()
-            cursor = conn.cursor()
-            cursor.execute(query, (ticker_symbol.upper(), company_name, current_price,
-                                 market_cap, sector, industry))
-            conn.commit()
-            stock_id = cursor.lastrowid
-            cursor.close()
-            conn.close()
-            print(f"✓ Stock {ticker_symbol} created successfully with ID: {stock_id}")
+            with _db_cursor() as (conn, cursor):
+                cursor.execute(_INSERT_STOCK_SQL, (ticker_symbol.upper(), company_name, current_price,
+                                       market_cap, sector, industry))
+                conn.commit()
+                stock_id = cursor.lastrowid
+            _stock_cache.clear()
+            logger.debug("Stock %s created successfully with ID: %s", ticker_symbol, stock_id)
             return stock_id
         except Error as e:
-            print(f"✗ Error creating stock: {e}")
-            if conn:
-                conn.rollback()
+            logger.error("Error creating stock: %s", e)
             return None
 
+    @staticmethod
+    def create_many(stocks: List[Tuple]) -> int:
+        """
+        Create many stocks in a single transaction.
+        stocks: (ticker_symbol, company_name, current_price, market_cap, sector, industry) tuples
+        Returns: number of stocks created (0 if the batch was rolled back)
+        """
+        created = _insert_many(_INSERT_STOCK_SQL, stocks, "creating stocks")
+        _stock_cache.clear()
+        if created:
+            logger.debug("%s stocks created successfully", created)
+        return created
+
     @staticmethod
     def read_by_id(stock_id: int) -> Optional[Dict]:
-        """Read a stock by ID."""
-        query = "SELECT * FROM Stocks WHERE stock_id = %s"
+        """Read a stock by ID (served from the row cache when fresh)."""
+        query = _STOCK_BY_ID_SQL
+        return _cached_fetch(_stock_cache, f"stock:id:{stock_id}", query, (stock_id,),
+                             "reading stock")
+
+    @staticmethod
+    def peek_by_id(stock_id: int) -> Optional[Dict]:
+        """
+        Return the stock only if this process has it cached; never touches the
+        database. With a shared cache, local rows can't be trusted without a
+        generation check, so this always misses.
+        """
+        if _stock_cache.shared:
+            return None
+        return _stock_cache.get(f"stock:id:{stock_id}")
+
+    @staticmethod
+    def read_by_id_with_recent_transactions(stock_id: int, limit: int = 5) -> Optional[Dict]:
+        """
+        Read a stock together with its transaction count and latest transactions.
+
+        The recent transactions are aggregated with JSON_ARRAYAGG so everything
+        arrives in one round trip; they are returned newest first under
+        'recent_transactions'.
+        """
+        query = _STOCK_WITH_RECENT_TXNS_SQL
         try:
-            conn = DatabaseConnection.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute(query, (stock_id,))
-            stock = cursor.fetchone()
-            cursor.close()
-            conn.close()
-            return stock
+            with _db_cursor(dictionary=True, readonly=True) as (conn, cursor):
+                cursor.execute(query, (stock_id, limit, stock_id))
+                stock = cursor.fetchone()
+        except Error as e:
+            logger.error("Error reading stock: %s", e)
+            return None
+
+        if stock:
+            raw = stock['recent_transactions']
+            recent = json.loads(raw, parse_float=Decimal) if raw else []
+            for txn in recent:
+                txn['transaction_date'] = datetime.fromisoformat(txn['transaction_date'])
+            # JSON_ARRAYAGG does not guarantee the subquery's order
+            recent.sort(key=lambda txn: txn['transaction_date'], reverse=True)
+            stock['recent_transactions'] = recent
+        return stock
+
+    @staticmethod
+    def get_ticker(stock_id: int) -> Optional[str]:
+        """Get just the ticker symbol for a stock ID."""
+        query = "SELECT ticker_symbol FROM Stocks WHERE stock_id = %s"
+        try:
+            with _db_cursor(readonly=True) as (conn, cursor):
+                cursor.execute(query, (stock_id,))
+                row = cursor.fetchone()
+            return row[0] if row else None
         except Error as e:
-            print(f"✗ Error reading stock: {e}")
+            logger.error("Error reading stock: %s", e)
             return None
 
     @staticmethod
     def read_all() -> List[Dict]:
-        """Read all stocks."""
-        query = "SELECT * FROM Stocks ORDER BY ticker_symbol"
+        """Read all stocks (served from the row cache when fresh)."""
+        return _cached_fetch(_stock_cache, "stock:all", _ALL_STOCKS_SQL, None,
+                             "reading stocks", many=True)
+
+    @staticmethod
+    def read_page(after_id: int = 0, limit: int = 100) -> Tuple[List[Dict], Optional[int]]:
+        """
+        Read up to limit stocks with stock_id > after_id, in stock_id order.
+        Returns: (rows, after_id for the next page, or None after the last page)
+        """
+        return _read_page("Stocks", _STOCK_COLUMNS, "stock_id", after_id, limit, "reading stocks")
+
+    @staticmethod
+    def read_all_rows() -> List[StockRow]:
+        """Read all stocks as StockRow objects (tuple cursor, no per-row dicts)."""
+        query = _ALL_STOCKS_SQL
         try:
-            conn = DatabaseConnection.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute(query)
-            stocks = cursor.fetchall()
-            cursor.close()
-            conn.close()
-            return stocks
+            with _db_cursor(readonly=True) as (conn, cursor):
+                cursor.execute(query)
+                return [StockRow(*row) for row in cursor.fetchall()]
         except Error as e:
-            print(f"✗ Error reading stocks: {e}")
+            logger.error("Error reading stocks: %s", e)
             return []
 
+    @staticmethod
+    def iter_all(after_ticker: Optional[str] = None,
+                 limit: Optional[int] = None) -> Iterator[Dict]:
+        """
+        Stream stocks without loading the full result set.
+
+        For keyset pagination pass the last ticker already shown as
+        `after_ticker`, plus a page `limit`. Rows hold only the listing
+        columns: company_name_short (first 30 characters) and display-ready
+        *_fmt columns formatted by MySQL.
+        """
+        query = """
+            SELECT s.stock_id, s.ticker_symbol, s.sector,
+                   LEFT(s.company_name, 30) AS company_name_short,
+                   CONCAT('$', s.current_price) AS current_price_fmt,
+                   CONCAT('$', FORMAT(s.market_cap, 0)) AS market_cap_fmt
+            FROM Stocks s
+        """
+        params = ()
+        if after_ticker is not None:
+            query += " WHERE s.ticker_symbol > %s"
+            params = (after_ticker,)
+        query += " ORDER BY s.ticker_symbol"
+        if limit is not None:
+            query += " LIMIT %s"
+            params += (limit,)
+        try:
+            yield from DatabaseConnection.stream(query, params)
+        except Error as e:
+            logger.error("Error reading stocks: %s", e)
+
     @staticmethod
     def update(stock_id: int, **kwargs) -> bool:
         """Update stock information."""
-        allowed_fields = ['ticker_symbol', 'company_name', 'current_price',
-                         'market_cap', 'sector', 'industry']
-        update_fields = {k: v for k, v in kwargs.items() if k in allowed_fields}
+        update_fields = {k: v for k, v in kwargs.items() if k in _STOCK_UPDATABLE}
 
         if not update_fields:
-            print("✗ No valid fields to update")
+            logger.warning("No valid fields to update")
             return False
 
         # Uppercase ticker symbol if present
         if 'ticker_symbol' in update_fields:
             update_fields['ticker_symbol'] = update_fields['ticker_symbol'].upper()
 
-        set_clause = ", ".join([f"{field} = %s" for field in update_fields.keys()])
-        query = f"UPDATE Stocks SET {set_clause} WHERE stock_id = %s"
-        values = list(update_fields.values()) + [stock_id]
+        fields = tuple(sorted(update_fields))
+        query = _update_sql("Stocks", "stock_id", fields)
+        values = [update_fields[field] for field in fields] + [stock_id]
 
         try:
-            conn = DatabaseConnection.get_connection()
-            cursor = conn.cursor()
-            cursor.execute(query, values)
-            conn.commit()
-            affected_rows = cursor.rowcount
-            cursor.close()
-            conn.close()
+            with _db_cursor() as (conn, cursor):
+                cursor.execute(query, values)
+                conn.commit()
+                affected_rows = cursor.rowcount
+            _stock_cache.clear()
 
             if affected_rows > 0:
-                print(f"✓ Stock {stock_id} updated successfully")
+                logger.debug("Stock %s updated successfully", stock_id)
                 return True
             else:
-                print(f"✗ No stock found with ID {stock_id}")
+                logger.info("No stock found with ID %s", stock_id)
                 return False
         except Error as e:
-            print(f"✗ Error updating stock: {e}")
-            if conn:
-                conn.rollback()
+            logger.error("Error updating stock: %s", e)
             return False
 
     @staticmethod
@@ -294,56 +1088,47 @@ class StockDAO:
         """Delete a stock by ID."""
         query = "DELETE FROM Stocks WHERE stock_id = %s"
         try:
-            conn = DatabaseConnection.get_connection()
-            cursor = conn.cursor()
-            cursor.execute(query, (stock_id,))
-            conn.commit()
-            affected_rows = cursor.rowcount
-            cursor.close()
-            conn.close()
+            with _db_cursor() as (conn, cursor):
+                cursor.execute(query, (stock_id,))
+                conn.commit()
+                affected_rows = cursor.rowcount
+            _stock_cache.clear()
 
             if affected_rows > 0:
-                print(f"✓ Stock {stock_id} deleted successfully")
+                logger.debug("Stock %s deleted successfully", stock_id)
                 return True
             else:
-                print(f"✗ No stock found with ID {stock_id}")
+                logger.info("No stock found with ID %s", stock_id)
                 return False
         except Error as e:
-            print(f"✗ Error deleting stock: {e}")
-            if conn:
-                conn.rollback()
+            logger.error("Error deleting stock: %s", e)
             return False
 
     @staticmethod
     def find_by_ticker(ticker_symbol: str) -> Optional[Dict]:
-        """Find a stock by ticker symbol."""
-        query = "SELECT * FROM Stocks WHERE ticker_symbol = %s"
-        try:
-            conn = DatabaseConnection.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute(query, (ticker_symbol.upper(),))
-            stock = cursor.fetchone()
-            cursor.close()
-            conn.close()
-            return stock
-        except Error as e:
-            print(f"✗ Error finding stock: {e}")
-            return None
+        """Find a stock by ticker symbol (served from the row cache when fresh)."""
+        # ticker_symbol is UNIQUE, so this is a single index probe
+        query = _STOCK_BY_TICKER_SQL
+        ticker_symbol = ticker_symbol.upper()
+        return _cached_fetch(_stock_cache, f"stock:ticker:{ticker_symbol}", query,
+                             (ticker_symbol,), "finding stock")
 
     @staticmethod
     def find_by_sector(sector: str) -> List[Dict]:
-        """Find all stocks in a specific sector."""
-        query = "SELECT * FROM Stocks WHERE sector = %s ORDER BY ticker_symbol"
+        """Find all stocks in a specific sector (served from the row cache when fresh)."""
+        return _cached_fetch(_stock_cache, f"stock:sector:{sector}", _STOCKS_BY_SECTOR_SQL,
+                             (sector,), "finding stocks by sector", many=True)
+
+    @staticmethod
+    def get_distinct_sectors() -> List[str]:
+        """Get the sorted list of distinct stock sectors."""
+        query = "SELECT DISTINCT sector FROM Stocks WHERE sector IS NOT NULL ORDER BY sector"
         try:
-            conn = DatabaseConnection.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute(query, (sector,))
-            stocks = cursor.fetchall()
-            cursor.close()
-            conn.close()
-            return stocks
+            with _db_cursor(readonly=True) as (conn, cursor):
+                cursor.execute(query)
+                return [row[0] for row in cursor.fetchall()]
         except Error as e:
-            print(f"✗ Error finding stocks by sector: {e}")
+            logger.error("Error reading sectors: %s", e)
             return []
 
 
@@ -359,86 +1144,75 @@ class PortfolioDAO:
             VALUES (%s, %s, %s, %s)
         """
         try:
-            conn = DatabaseConnection.get_connection()
-            cursor = conn.cursor()
-            cursor.execute(query, (user_id, portfolio_name, description, total_value))
-            conn.commit()
-            portfolio_id = cursor.lastrowid
-            cursor.close()
-            conn.close()
-            print(f"✓ Portfolio '{portfolio_name}' created successfully with ID: {portfolio_id}")
+            with _db_cursor() as (conn, cursor):
+                cursor.execute(query, (user_id, portfolio_name, description, total_value))
+                conn.commit()
+                portfolio_id = cursor.lastrowid
+            logger.debug("Portfolio '%s' created successfully with ID: %s", portfolio_name, portfolio_id)
             return portfolio_id
         except Error as e:
-            print(f"✗ Error creating portfolio: {e}")
-            if conn:
-                conn.rollback()
+            logger.error("Error creating portfolio: %s", e)
             return None
 
     @staticmethod
     def read_by_id(portfolio_id: int) -> Optional[Dict]:
         """Read a portfolio by ID."""
-        query = "SELECT * FROM Portfolios WHERE portfolio_id = %s"
+        query = _PORTFOLIO_BY_ID_SQL
         try:
-            conn = DatabaseConnection.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute(query, (portfolio_id,))
-            portfolio = cursor.fetchone()
-            cursor.close()
-            conn.close()
-            return portfolio
+            with _db_cursor(dictionary=True, readonly=True) as (conn, cursor):
+                cursor.execute(query, (portfolio_id,))
+                return cursor.fetchone()
         except Error as e:
-            print(f"✗ Error reading portfolio: {e}")
+            logger.error("Error reading portfolio: %s", e)
             return None
 
     @staticmethod
     def read_all() -> List[Dict]:
         """Read all portfolios."""
-        query = "SELECT * FROM Portfolios ORDER BY created_at DESC"
+        query = _ALL_PORTFOLIOS_SQL
         try:
-            conn = DatabaseConnection.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute(query)
-            portfolios = cursor.fetchall()
-            cursor.close()
-            conn.close()
-            return portfolios
+            with _db_cursor(dictionary=True, readonly=True) as (conn, cursor):
+                cursor.execute(query)
+                return cursor.fetchall()
         except Error as e:
-            print(f"✗ Error reading portfolios: {e}")
+            logger.error("Error reading portfolios: %s", e)
             return []
 
+    @staticmethod
+    def read_page(after_id: int = 0, limit: int = 100) -> Tuple[List[Dict], Optional[int]]:
+        """
+        Read up to limit portfolios with portfolio_id > after_id, in portfolio_id order.
+        Returns: (rows, after_id for the next page, or None after the last page)
+        """
+        return _read_page("Portfolios", _PORTFOLIO_COLUMNS, "portfolio_id", after_id, limit, "reading portfolios")
+
     @staticmethod
     def update(portfolio_id: int, **kwargs) -> bool:
         """Update portfolio information."""
-        allowed_fields = ['portfolio_name', 'description', 'total_value', 'is_active']
-        update_fields = {k: v for k, v in kwargs.items() if k in allowed_fields}
+        update_fields = {k: v for k, v in kwargs.items() if k in _PORTFOLIO_UPDATABLE}
 
         if not update_fields:
-            print("✗ No valid fields to update")
+            logger.warning("No valid fields to update")
             return False
 
-        set_clause = ", ".join([f"{field} = %s" for field in update_fields.keys()])
-        query = f"UPDATE Portfolios SET {set_clause} WHERE portfolio_id = %s"
-        values = list(update_fields.values()) + [portfolio_id]
+        fields = tuple(sorted(update_fields))
+        query = _update_sql("Portfolios", "portfolio_id", fields)
+        values = [update_fields[field] for field in fields] + [portfolio_id]
 
         try:
-            conn = DatabaseConnection.get_connection()
-            cursor = conn.cursor()
-            cursor.execute(query, values)
-            conn.commit()
-            affected_rows = cursor.rowcount
-            cursor.close()
-            conn.close()
+            with _db_cursor() as (conn, cursor):
+                cursor.execute(query, values)
+                conn.commit()
+                affected_rows = cursor.rowcount
 
             if affected_rows > 0:
-                print(f"✓ Portfolio {portfolio_id} updated successfully")
+                logger.debug("Portfolio %s updated successfully", portfolio_id)
                 return True
             else:
-                print(f"✗ No portfolio found with ID {portfolio_id}")
+                logger.info("No portfolio found with ID %s", portfolio_id)
                 return False
         except Error as e:
-            print(f"✗ Error updating portfolio: {e}")
-            if conn:
-                conn.rollback()
+            logger.error("Error updating portfolio: %s", e)
             return False
 
     @staticmethod
@@ -446,40 +1220,56 @@ class PortfolioDAO:
         """Delete a portfolio by ID."""
         query = "DELETE FROM Portfolios WHERE portfolio_id = %s"
         try:
-            conn = DatabaseConnection.get_connection()
-            cursor = conn.cursor()
-            cursor.execute(query, (portfolio_id,))
-            conn.commit()
-            affected_rows = cursor.rowcount
-            cursor.close()
-            conn.close()
+            with _db_cursor() as (conn, cursor):
+                cursor.execute(query, (portfolio_id,))
+                conn.commit()
+                affected_rows = cursor.rowcount
 
             if affected_rows > 0:
-                print(f"✓ Portfolio {portfolio_id} deleted successfully")
+                logger.debug("Portfolio %s deleted successfully", portfolio_id)
                 return True
             else:
-                print(f"✗ No portfolio found with ID {portfolio_id}")
+                logger.info("No portfolio found with ID %s", portfolio_id)
                 return False
         except Error as e:
-            print(f"✗ Error deleting portfolio: {e}")
-            if conn:
-                conn.rollback()
+            logger.error("Error deleting portfolio: %s", e)
             return False
 
     @staticmethod
     def find_by_user(user_id: int) -> List[Dict]:
         """Find all portfolios for a specific user."""
-        query = "SELECT * FROM Portfolios WHERE user_id = %s ORDER BY created_at DESC"
+        query = _PORTFOLIOS_BY_USER_SQL
         try:
-            conn = DatabaseConnection.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute(query, (user_id,))
-            portfolios = cursor.fetchall()
-            cursor.close()
-            conn.close()
-            return portfolios
+            with _db_cursor(dictionary=True, readonly=True) as (conn, cursor):
+                cursor.execute(query, (user_id,))
+                return cursor.fetchall()
         except Error as e:
-            print(f"✗ Error finding portfolios: {e}")
+            logger.error("Error finding portfolios: %s", e)
+            return []
+
+    @staticmethod
+    def find_by_user_with_owner(user_id: int) -> List[Dict]:
+        """
+        Find a user's portfolios joined with the owner's details.
+
+        Each row carries the user's name, account_balance and combined_value
+        (a window SUM of total_value). A user with no portfolios yields one
+        row whose portfolio columns are NULL; an unknown user yields no rows.
+        """
+        query = """
+            SELECT u.username, u.first_name, u.last_name, u.account_balance,
+                   p.*, SUM(p.total_value) OVER () AS combined_value
+            FROM Users u
+            LEFT JOIN Portfolios p ON p.user_id = u.user_id
+            WHERE u.user_id = %s
+            ORDER BY p.created_at DESC
+        """
+        try:
+            with _db_cursor(dictionary=True, readonly=True) as (conn, cursor):
+                cursor.execute(query, (user_id,))
+                return cursor.fetchall()
+        except Error as e:
+            logger.error("Error finding portfolios: %s", e)
             return []
 
 
@@ -489,95 +1279,143 @@ class TransactionDAO:
     @staticmethod
     def create(user_id: int, stock_id: int, portfolio_id: int, transaction_type: str,
                quantity: int, price_per_share: Decimal, notes: str = None) -> Optional[int]:
-        """Create a new transaction."""
-        total_amount = quantity * price_per_share
+        """Create a new transaction (total_amount is computed by the database)."""
+        try:
+            with _db_cursor() as (conn, cursor):
+                cursor.execute(_INSERT_TXN_SQL, (user_id, stock_id, portfolio_id, transaction_type.upper(),
+                                                 quantity, price_per_share, notes))
+                conn.commit()
+                transaction_id = cursor.lastrowid
+            logger.debug("Transaction created successfully with ID: %s", transaction_id)
+            return transaction_id
+        except Error as e:
+            logger.error("Error creating transaction: %s", e)
+            return None
+
+    @staticmethod
+    def create_settled(user_id: int, stock_id: int, portfolio_id: int, transaction_type: str,
+                       quantity: int, price_per_share: Decimal, notes: str = None) -> Optional[Dict]:
+        """
+        Create a transaction together with its balance change and portfolio
+        revaluation, committed as a single database transaction.
+
+        A BUY debits quantity * price_per_share only if the balance covers it;
+        a SELL credits it. The portfolio's total_value is then recomputed.
+        Returns: {'transaction_id', 'new_balance', 'portfolio_value'}, with every
+        value None if a BUY isn't covered (nothing is written); None if a
+        database error rolled the whole transaction back
+        """
+        transaction_type = transaction_type.upper()
+        amount = quantity * price_per_share
+        try:
+            with _db_cursor(buffered=True) as (conn, cursor):
+                if transaction_type == 'BUY':
+                    cursor.execute(_DEBIT_USER_SQL, (amount, user_id, amount))
+                    if cursor.rowcount == 0:
+                        conn.rollback()
+                        return {'transaction_id': None, 'new_balance': None, 'portfolio_value': None}
+                cursor.execute(_INSERT_TXN_SQL, (user_id, stock_id, portfolio_id, transaction_type,
+                                                 quantity, price_per_share, notes))
+                transaction_id = cursor.lastrowid
+                if transaction_type == 'SELL':
+                    cursor.execute(_CREDIT_USER_SQL, (amount, user_id))
+                cursor.execute("SELECT account_balance FROM Users WHERE user_id = %s", (user_id,))
+                new_balance = cursor.fetchone()[0]
+                cursor.execute(_REVALUE_PORTFOLIO_SQL, (portfolio_id, portfolio_id))
+                cursor.execute("SELECT total_value FROM Portfolios WHERE portfolio_id = %s",
+                               (portfolio_id,))
+                portfolio_value = cursor.fetchone()[0]
+                conn.commit()
+        except Error as e:
+            logger.error("Error creating transaction: %s", e)
+            return None
+        _user_cache.clear()
+        logger.debug("Transaction created successfully with ID: %s", transaction_id)
+        return {'transaction_id': transaction_id, 'new_balance': new_balance,
+                'portfolio_value': portfolio_value}
+
+    @staticmethod
+    def get_transaction_context(user_id: int, stock_id: int, portfolio_id: int) -> Optional[Dict]:
+        """
+        Fetch the user, stock and portfolio a transaction refers to in one query.
+
+        Each id column is NULL when that row does not exist.
+        """
         query = """
-            INSERT INTO Transactions
-            (user_id, stock_id, portfolio_id, transaction_type, quantity, price_per_share, total_amount, notes)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+            SELECT u.user_id, u.account_balance, s.stock_id,
+                   p.portfolio_id, p.user_id AS portfolio_user_id
+            FROM (SELECT 1) AS ctx
+            LEFT JOIN Users u ON u.user_id = %s
+            LEFT JOIN Stocks s ON s.stock_id = %s
+            LEFT JOIN Portfolios p ON p.portfolio_id = %s
         """
         try:
-            conn = DatabaseConnection.get_connection()
-            cursor = conn.cursor()
-            cursor.execute(query, (user_id, stock_id, portfolio_id, transaction_type.upper(),
-                                 quantity, price_per_share, total_amount, notes))
-            conn.commit()
-            transaction_id = cursor.lastrowid
-            cursor.close()
-            conn.close()
-            print(f"✓ Transaction created successfully with ID: {transaction_id}")
-            return transaction_id
+            with _db_cursor(dictionary=True, readonly=True) as (conn, cursor):
+                cursor.execute(query, (user_id, stock_id, portfolio_id))
+                return cursor.fetchone()
         except Error as e:
-            print(f"✗ Error creating transaction: {e}")
-            if conn:
-                conn.rollback()
+            logger.error("Error reading transaction context: %s", e)
             return None
 
     @staticmethod
     def read_by_id(transaction_id: int) -> Optional[Dict]:
         """Read a transaction by ID."""
-        query = "SELECT * FROM Transactions WHERE transaction_id = %s"
+        query = _TXN_BY_ID_SQL
         try:
-            conn = DatabaseConnection.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute(query, (transaction_id,))
-            transaction = cursor.fetchone()
-            cursor.close()
-            conn.close()
-            return transaction
+            with _db_cursor(dictionary=True, readonly=True) as (conn, cursor):
+                cursor.execute(query, (transaction_id,))
+                return cursor.fetchone()
         except Error as e:
-            print(f"✗ Error reading transaction: {e}")
+            logger.error("Error reading transaction: %s", e)
             return None
 
     @staticmethod
     def read_all() -> List[Dict]:
         """Read all transactions."""
-        query = "SELECT * FROM Transactions ORDER BY transaction_date DESC"
+        query = _ALL_TXNS_SQL
         try:
-            conn = DatabaseConnection.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute(query)
-            transactions = cursor.fetchall()
-            cursor.close()
-            conn.close()
-            return transactions
+            with _db_cursor(dictionary=True, readonly=True) as (conn, cursor):
+                cursor.execute(query)
+                return cursor.fetchall()
         except Error as e:
-            print(f"✗ Error reading transactions: {e}")
+            logger.error("Error reading transactions: %s", e)
             return []
 
+    @staticmethod
+    def read_page(after_id: int = 0, limit: int = 100) -> Tuple[List[Dict], Optional[int]]:
+        """
+        Read up to limit transactions with transaction_id > after_id, in transaction_id order.
+        Returns: (rows, after_id for the next page, or None after the last page)
+        """
+        return _read_page("Transactions", _TXN_COLUMNS, "transaction_id", after_id, limit, "reading transactions")
+
     @staticmethod
     def update(transaction_id: int, **kwargs) -> bool:
         """Update transaction information (limited fields for data integrity)."""
-        allowed_fields = ['notes']  # Only notes should be editable
-        update_fields = {k: v for k, v in kwargs.items() if k in allowed_fields}
+        update_fields = {k: v for k, v in kwargs.items() if k in _TXN_UPDATABLE}
 
         if not update_fields:
-            print("✗ No valid fields to update (only notes can be modified)")
+            logger.warning("No valid fields to update (only notes can be modified)")
             return False
 
-        set_clause = ", ".join([f"{field} = %s" for field in update_fields.keys()])
-        query = f"UPDATE Transactions SET {set_clause} WHERE transaction_id = %s"
-        values = list(update_fields.values()) + [transaction_id]
+        fields = tuple(sorted(update_fields))
+        query = _update_sql("Transactions", "transaction_id", fields)
+        values = [update_fields[field] for field in fields] + [transaction_id]
 
         try:
-            conn = DatabaseConnection.get_connection()
-            cursor = conn.cursor()
-            cursor.execute(query, values)
-            conn.commit()
-            affected_rows = cursor.rowcount
-            cursor.close()
-            conn.close()
+            with _db_cursor() as (conn, cursor):
+                cursor.execute(query, values)
+                conn.commit()
+                affected_rows = cursor.rowcount
 
             if affected_rows > 0:
-                print(f"✓ Transaction {transaction_id} updated successfully")
+                logger.debug("Transaction %s updated successfully", transaction_id)
                 return True
             else:
-                print(f"✗ No transaction found with ID {transaction_id}")
+                logger.info("No transaction found with ID %s", transaction_id)
                 return False
         except Error as e:
-            print(f"✗ Error updating transaction: {e}")
-            if conn:
-                conn.rollback()
+            logger.error("Error updating transaction: %s", e)
             return False
 
     @staticmethod
@@ -585,29 +1423,34 @@ class TransactionDAO:
         """Delete a transaction by ID."""
         query = "DELETE FROM Transactions WHERE transaction_id = %s"
         try:
-            conn = DatabaseConnection.get_connection()
-            cursor = conn.cursor()
-            cursor.execute(query, (transaction_id,))
-            conn.commit()
-            affected_rows = cursor.rowcount
-            cursor.close()
-            conn.close()
+            with _db_cursor() as (conn, cursor):
+                cursor.execute(query, (transaction_id,))
+                conn.commit()
+                affected_rows = cursor.rowcount
 
             if affected_rows > 0:
-                print(f"✓ Transaction {transaction_id} deleted successfully")
+                logger.debug("Transaction %s deleted successfully", transaction_id)
                 return True
             else:
-                print(f"✗ No transaction found with ID {transaction_id}")
+                logger.info("No transaction found with ID %s", transaction_id)
                 return False
         except Error as e:
-            print(f"✗ Error deleting transaction: {e}")
-            if conn:
-                conn.rollback()
+            logger.error("Error deleting transaction: %s", e)
             return False
 
     @staticmethod
     def find_by_user(user_id: int) -> List[Dict]:
         """Find all transactions for a specific user."""
+        return list(TransactionDAO.iter_by_user(user_id))
+
+    @staticmethod
+    def iter_by_user(user_id: int) -> Iterator[Dict]:
+        """
+        Stream a user's transactions, newest first, with ticker, company and portfolio name.
+
+        Rows come from an unbuffered cursor, so memory stays flat however long
+        the history; the connection is held until iteration finishes.
+        """
         query = """
             SELECT t.*, s.ticker_symbol, s.company_name, p.portfolio_name
             FROM Transactions t
@@ -617,20 +1460,55 @@ class TransactionDAO:
             ORDER BY t.transaction_date DESC
         """
         try:
-            conn = DatabaseConnection.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute(query, (user_id,))
-            transactions = cursor.fetchall()
-            cursor.close()
-            conn.close()
-            return transactions
+            yield from DatabaseConnection.stream(query, (user_id,))
         except Error as e:
-            print(f"✗ Error finding transactions: {e}")
-            return []
+            logger.error("Error finding transactions: %s", e)
+
+    @staticmethod
+    def iter_by_user_detailed(user_id: int, limit: Optional[int] = None,
+                              offset: int = 0) -> Iterator[Dict]:
+        """
+        Stream a user's transactions joined with stock, portfolio and user details.
+
+        Each row also carries display-ready *_fmt columns, portfolio_name_short
+        (first 15 characters) and the user's txn_count, buy_total and
+        sell_total, computed in the same query with window aggregates. Paging
+        uses LIMIT/OFFSET because the windows are evaluated before LIMIT, so
+        the totals still cover every transaction.
+        """
+        query = """
+            SELECT t.*, s.ticker_symbol, LEFT(p.portfolio_name, 15) AS portfolio_name_short,
+                   u.username, u.first_name, u.last_name,
+                   CONCAT('$', t.price_per_share) AS price_per_share_fmt,
+                   CONCAT('$', t.total_amount) AS total_amount_fmt,
+                   CAST(DATE(t.transaction_date) AS CHAR) AS transaction_date_fmt,
+                   COUNT(*) OVER () AS txn_count,
+                   SUM(CASE WHEN t.transaction_type = 'BUY' THEN t.total_amount ELSE 0 END) OVER () AS buy_total,
+                   SUM(CASE WHEN t.transaction_type = 'SELL' THEN t.total_amount ELSE 0 END) OVER () AS sell_total
+            FROM Transactions t
+            JOIN Stocks s ON t.stock_id = s.stock_id
+            JOIN Portfolios p ON t.portfolio_id = p.portfolio_id
+            JOIN Users u ON t.user_id = u.user_id
+            WHERE t.user_id = %s
+            ORDER BY t.transaction_date DESC, t.transaction_id DESC
+        """
+        params = (user_id,)
+        if limit is not None:
+            query += " LIMIT %s OFFSET %s"
+            params += (limit, offset)
+        try:
+            yield from DatabaseConnection.stream(query, params)
+        except Error as e:
+            logger.error("Error finding transactions: %s", e)
 
     @staticmethod
     def find_by_stock(stock_id: int) -> List[Dict]:
         """Find all transactions for a specific stock."""
+        return list(TransactionDAO.iter_by_stock(stock_id))
+
+    @staticmethod
+    def iter_by_stock(stock_id: int) -> Iterator[Dict]:
+        """Stream a stock's transactions, newest first, with username and portfolio name."""
         query = """
             SELECT t.*, u.username, p.portfolio_name
             FROM Transactions t
@@ -640,16 +1518,9 @@ class TransactionDAO:
             ORDER BY t.transaction_date DESC
         """
         try:
-            conn = DatabaseConnection.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute(query, (stock_id,))
-            transactions = cursor.fetchall()
-            cursor.close()
-            conn.close()
-            return transactions
+            yield from DatabaseConnection.stream(query, (stock_id,))
         except Error as e:
-            print(f"✗ Error finding transactions: {e}")
-            return []
+            logger.error("Error finding transactions: %s", e)
 
     @staticmethod
     def find_by_portfolio(portfolio_id: int) -> List[Dict]:
@@ -661,15 +1532,11 @@ class TransactionDAO:
             ORDER BY t.transaction_date DESC
         """
         try:
-            conn = DatabaseConnection.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute(query, (portfolio_id,))
-            transactions = cursor.fetchall()
-            cursor.close()
-            conn.close()
-            return transactions
+            with _db_cursor(dictionary=True, readonly=True) as (conn, cursor):
+                cursor.execute(query, (portfolio_id,))
+                return cursor.fetchall()
         except Error as e:
-            print(f"✗ Error finding transactions: {e}")
+            logger.error("Error finding transactions: %s", e)
             return []
 
 
@@ -680,91 +1547,76 @@ class WatchlistDAO:
     def create(user_id: int, stock_id: int, target_price: Decimal = None,
                notes: str = None, alert_enabled: bool = False) -> Optional[int]:
         """Add a stock to user's watchlist."""
-        query = """
-            INSERT INTO Watchlists (user_id, stock_id, target_price, notes, alert_enabled)
-            VALUES (%s, %s, %s, %s, %s)
-        """
         try:
-            conn = DatabaseConnection.get_connection()
-            cursor = conn.cursor()
-            cursor.execute(query, (user_id, stock_id, target_price, notes, alert_enabled))
-            conn.commit()
-            watchlist_id = cursor.lastrowid
-            cursor.close()
-            conn.close()
-            print(f"✓ Stock added to watchlist with ID: {watchlist_id}")
+            with _db_cursor() as (conn, cursor):
+                cursor.execute(_INSERT_WATCHLIST_SQL, (user_id, stock_id, target_price, notes, alert_enabled))
+                conn.commit()
+                watchlist_id = cursor.lastrowid
+            logger.debug("Stock added to watchlist with ID: %s", watchlist_id)
             return watchlist_id
         except Error as e:
-            print(f"✗ Error adding to watchlist: {e}")
-            if conn:
-                conn.rollback()
+            logger.error("Error adding to watchlist: %s", e)
             return None
 
     @staticmethod
     def read_by_id(watchlist_id: int) -> Optional[Dict]:
         """Read a watchlist entry by ID."""
-        query = "SELECT * FROM Watchlists WHERE watchlist_id = %s"
+        query = _WATCHLIST_BY_ID_SQL
         try:
-            conn = DatabaseConnection.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute(query, (watchlist_id,))
-            watchlist = cursor.fetchone()
-            cursor.close()
-            conn.close()
-            return watchlist
+            with _db_cursor(dictionary=True, readonly=True) as (conn, cursor):
+                cursor.execute(query, (watchlist_id,))
+                return cursor.fetchone()
         except Error as e:
-            print(f"✗ Error reading watchlist: {e}")
+            logger.error("Error reading watchlist: %s", e)
             return None
 
     @staticmethod
     def read_all() -> List[Dict]:
         """Read all watchlist entries."""
-        query = "SELECT * FROM Watchlists ORDER BY added_date DESC"
+        query = _ALL_WATCHLISTS_SQL
         try:
-            conn = DatabaseConnection.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute(query)
-            watchlists = cursor.fetchall()
-            cursor.close()
-            conn.close()
-            return watchlists
+            with _db_cursor(dictionary=True, readonly=True) as (conn, cursor):
+                cursor.execute(query)
+                return cursor.fetchall()
         except Error as e:
-            print(f"✗ Error reading watchlists: {e}")
+            logger.error("Error reading watchlists: %s", e)
             return []
 
+    @staticmethod
+    def read_page(after_id: int = 0, limit: int = 100) -> Tuple[List[Dict], Optional[int]]:
+        """
+        Read up to limit watchlist entries with watchlist_id > after_id, in watchlist_id order.
+        Returns: (rows, after_id for the next page, or None after the last page)
+        """
+        return _read_page("Watchlists", _WATCHLIST_COLUMNS, "watchlist_id", after_id, limit, "reading watchlists")
+
     @staticmethod
     def update(watchlist_id: int, **kwargs) -> bool:
         """Update watchlist entry."""
-        allowed_fields = ['target_price', 'notes', 'alert_enabled']
-        update_fields = {k: v for k, v in kwargs.items() if k in allowed_fields}
+        update_fields = {k: v for k, v in kwargs.items() if k in _WATCHLIST_UPDATABLE}
 
         if not update_fields:
-            print("✗ No valid fields to update")
+            logger.warning("No valid fields to update")
             return False
 
-        set_clause = ", ".join([f"{field} = %s" for field in update_fields.keys()])
-        query = f"UPDATE Watchlists SET {set_clause} WHERE watchlist_id = %s"
-        values = list(update_fields.values()) + [watchlist_id]
+        fields = tuple(sorted(update_fields))
+        query = _update_sql("Watchlists", "watchlist_id", fields)
+        values = [update_fields[field] for field in fields] + [watchlist_id]
 
         try:
-            conn = DatabaseConnection.get_connection()
-            cursor = conn.cursor()
-            cursor.execute(query, values)
-            conn.commit()
-            affected_rows = cursor.rowcount
-            cursor.close()
-            conn.close()
+            with _db_cursor() as (conn, cursor):
+                cursor.execute(query, values)
+                conn.commit()
+                affected_rows = cursor.rowcount
 
             if affected_rows > 0:
-                print(f"✓ Watchlist entry {watchlist_id} updated successfully")
+                logger.debug("Watchlist entry %s updated successfully", watchlist_id)
                 return True
             else:
-                print(f"✗ No watchlist entry found with ID {watchlist_id}")
+                logger.info("No watchlist entry found with ID %s", watchlist_id)
                 return False
         except Error as e:
-            print(f"✗ Error updating watchlist: {e}")
-            if conn:
-                conn.rollback()
+            logger.error("Error updating watchlist: %s", e)
             return False
 
     @staticmethod
@@ -772,24 +1624,19 @@ class WatchlistDAO:
         """Delete a watchlist entry by ID."""
         query = "DELETE FROM Watchlists WHERE watchlist_id = %s"
         try:
-            conn = DatabaseConnection.get_connection()
-            cursor = conn.cursor()
-            cursor.execute(query, (watchlist_id,))
-            conn.commit()
-            affected_rows = cursor.rowcount
-            cursor.close()
-            conn.close()
+            with _db_cursor() as (conn, cursor):
+                cursor.execute(query, (watchlist_id,))
+                conn.commit()
+                affected_rows = cursor.rowcount
 
             if affected_rows > 0:
-                print(f"✓ Watchlist entry {watchlist_id} deleted successfully")
+                logger.debug("Watchlist entry %s deleted successfully", watchlist_id)
                 return True
             else:
-                print(f"✗ No watchlist entry found with ID {watchlist_id}")
+                logger.info("No watchlist entry found with ID %s", watchlist_id)
                 return False
         except Error as e:
-            print(f"✗ Error deleting watchlist entry: {e}")
-            if conn:
-                conn.rollback()
+            logger.error("Error deleting watchlist entry: %s", e)
             return False
 
     @staticmethod
@@ -803,20 +1650,70 @@ class WatchlistDAO:
             ORDER BY w.added_date DESC
         """
         try:
-            conn = DatabaseConnection.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute(query, (user_id,))
-            watchlist = cursor.fetchall()
-            cursor.close()
-            conn.close()
-            return watchlist
+            with _db_cursor(dictionary=True, readonly=True) as (conn, cursor):
+                cursor.execute(query, (user_id,))
+                return cursor.fetchall()
         except Error as e:
-            print(f"✗ Error finding watchlist: {e}")
+            logger.error("Error finding watchlist: %s", e)
+            return []
+
+    @staticmethod
+    def find_by_user_with_owner(user_id: int) -> List[Dict]:
+        """
+        Find a user's watchlist with stock details, joined with the owner's name.
+
+        company_name_short holds the first 25 characters of the company name.
+        A user with an empty watchlist yields one row whose watchlist columns
+        are NULL; an unknown user yields no rows.
+        """
+        query = """
+            SELECT u.username, u.first_name, u.last_name,
+                   w.*, s.ticker_symbol, LEFT(s.company_name, 25) AS company_name_short,
+                   s.current_price, s.sector
+            FROM Users u
+            LEFT JOIN (Watchlists w JOIN Stocks s ON w.stock_id = s.stock_id)
+                ON w.user_id = u.user_id
+            WHERE u.user_id = %s
+            ORDER BY w.added_date DESC
+        """
+        try:
+            with _db_cursor(dictionary=True, readonly=True) as (conn, cursor):
+                cursor.execute(query, (user_id,))
+                return cursor.fetchall()
+        except Error as e:
+            logger.error("Error finding watchlist: %s", e)
+            return []
+
+    @staticmethod
+    def find_triggered_alerts(user_id: int) -> List[Tuple]:
+        """
+        Find alert-enabled watchlist entries whose stock is at or below target price.
+
+        Rows are (ticker_symbol, company_name, current_price, target_price) tuples.
+        """
+        query = """
+            SELECT s.ticker_symbol, s.company_name, s.current_price, w.target_price
+            FROM Watchlists w
+            JOIN Stocks s ON w.stock_id = s.stock_id
+            WHERE w.user_id = %s
+              AND w.alert_enabled = TRUE
+              AND w.target_price IS NOT NULL
+              AND s.current_price <= w.target_price
+            ORDER BY w.added_date DESC
+        """
+        try:
+            with _db_cursor(readonly=True) as (conn, cursor):
+                cursor.execute(query, (user_id,))
+                return cursor.fetchall()
+        except Error as e:
+            logger.error("Error finding price alerts: %s", e)
             return []
 
 
 # Example usage and testing
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(levelname)s %(message)s")
+
     # Initialize connection pool
     DatabaseConnection.initialize_pool(
         host='localhost',
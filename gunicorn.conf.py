@@ -0,0 +1,12 @@
+"""
+Gunicorn settings for the API, read automatically from the working directory:
+    gunicorn service_layer:app
+"""
+
+import os
+
+from service_layer import worker_count
+
+worker_class = "uvicorn.workers.UvicornWorker"
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = worker_count()
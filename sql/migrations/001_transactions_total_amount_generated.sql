@@ -0,0 +1,35 @@
+-- ============================================
+-- Migration 001: derive Transactions.total_amount in the database
+-- ============================================
+-- Run once on databases created from schema.sql before total_amount became
+-- a generated column. The application no longer inserts total_amount, so
+-- POST /transactions fails on an old database until this has been applied.
+-- Fresh databases built from schema.sql already have the new column.
+--
+-- Requires MySQL 8.0.16+ (enforced CHECK constraints). Safe to re-run.
+--
+-- Usage: mysql -u root -p stock_tracker < sql/migrations/001_transactions_total_amount_generated.sql
+
+-- The old column's CHECK (total_amount > 0) was declared inline, so MySQL
+-- gave it a generated name (Transactions_chk_N); look it up and drop it
+SET @total_check = (
+    SELECT tc.CONSTRAINT_NAME
+    FROM information_schema.TABLE_CONSTRAINTS tc
+    JOIN information_schema.CHECK_CONSTRAINTS cc
+        ON cc.CONSTRAINT_SCHEMA = tc.CONSTRAINT_SCHEMA
+        AND cc.CONSTRAINT_NAME = tc.CONSTRAINT_NAME
+    WHERE tc.TABLE_SCHEMA = DATABASE()
+        AND tc.TABLE_NAME = 'Transactions'
+        AND tc.CONSTRAINT_TYPE = 'CHECK'
+        AND cc.CHECK_CLAUSE LIKE '%total_amount%'
+    LIMIT 1
+);
+SET @drop_check = IF(@total_check IS NULL, 'DO 0',
+    CONCAT('ALTER TABLE Transactions DROP CHECK `', @total_check, '`'));
+PREPARE stmt FROM @drop_check;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
+
+-- Existing rows are recomputed from quantity * price_per_share
+ALTER TABLE Transactions MODIFY total_amount DECIMAL(15, 2)
+    GENERATED ALWAYS AS (quantity * price_per_share) STORED;
@@ -58,22 +58,22 @@ INSERT INTO Portfolios (user_id, portfolio_name, description, total_value, creat
 -- ============================================
 -- Populate Transactions Table (15 rows)
 -- ============================================
-INSERT INTO Transactions (user_id, stock_id, portfolio_id, transaction_type, quantity, price_per_share, total_amount, transaction_date, notes) VALUES
-(1, 1, 1, 'BUY', 50, 175.50, 8775.00, '2024-01-15 11:00:00', 'Initial purchase of Apple stock'),
-(1, 2, 1, 'BUY', 30, 420.00, 12600.00, '2024-01-16 14:30:00', 'Added Microsoft to tech portfolio'),
-(2, 6, 3, 'BUY', 25, 850.00, 21250.00, '2024-02-21 10:15:00', 'NVIDIA investment for AI exposure'),
-(2, 5, 3, 'BUY', 100, 170.00, 17000.00, '2024-02-22 09:45:00', 'Tesla long position'),
-(3, 1, 4, 'BUY', 200, 172.00, 34400.00, '2024-01-06 10:30:00', 'Large Apple position'),
-(3, 2, 5, 'BUY', 75, 415.00, 31125.00, '2024-01-11 13:00:00', 'Microsoft for tech spec portfolio'),
-(3, 3, 5, 'BUY', 100, 140.00, 14000.00, '2024-01-12 11:20:00', 'Added Google to holdings'),
-(4, 7, 6, 'BUY', 50, 195.00, 9750.00, '2024-03-11 10:45:00', 'JPMorgan Chase investment'),
-(5, 6, 7, 'BUY', 40, 860.00, 34400.00, '2024-02-02 09:30:00', 'NVIDIA for AI portfolio'),
-(6, 9, 8, 'BUY', 100, 160.00, 16000.00, '2024-03-26 11:15:00', 'Johnson & Johnson blue chip'),
-(7, 8, 9, 'BUY', 75, 275.00, 20625.00, '2024-01-21 14:00:00', 'Visa for value portfolio'),
-(8, 9, 10, 'BUY', 120, 158.00, 18960.00, '2024-03-01 10:00:00', 'Healthcare sector investment'),
-(9, 7, 11, 'BUY', 150, 196.50, 29475.00, '2024-03-06 09:15:00', 'Financial sector exposure'),
-(10, 4, 12, 'BUY', 50, 180.00, 9000.00, '2024-03-16 10:30:00', 'Amazon starter position'),
-(2, 5, 3, 'SELL', 20, 175.00, 3500.00, '2024-03-20 15:30:00', 'Partial Tesla profit taking');
+INSERT INTO Transactions (user_id, stock_id, portfolio_id, transaction_type, quantity, price_per_share, transaction_date, notes) VALUES
+(1, 1, 1, 'BUY', 50, 175.50, '2024-01-15 11:00:00', 'Initial purchase of Apple stock'),
+(1, 2, 1, 'BUY', 30, 420.00, '2024-01-16 14:30:00', 'Added Microsoft to tech portfolio'),
+(2, 6, 3, 'BUY', 25, 850.00, '2024-02-21 10:15:00', 'NVIDIA investment for AI exposure'),
+(2, 5, 3, 'BUY', 100, 170.00, '2024-02-22 09:45:00', 'Tesla long position'),
+(3, 1, 4, 'BUY', 200, 172.00, '2024-01-06 10:30:00', 'Large Apple position'),
+(3, 2, 5, 'BUY', 75, 415.00, '2024-01-11 13:00:00', 'Microsoft for tech spec portfolio'),
+(3, 3, 5, 'BUY', 100, 140.00, '2024-01-12 11:20:00', 'Added Google to holdings'),
+(4, 7, 6, 'BUY', 50, 195.00, '2024-03-11 10:45:00', 'JPMorgan Chase investment'),
+(5, 6, 7, 'BUY', 40, 860.00, '2024-02-02 09:30:00', 'NVIDIA for AI portfolio'),
+(6, 9, 8, 'BUY', 100, 160.00, '2024-03-26 11:15:00', 'Johnson & Johnson blue chip'),
+(7, 8, 9, 'BUY', 75, 275.00, '2024-01-21 14:00:00', 'Visa for value portfolio'),
+(8, 9, 10, 'BUY', 120, 158.00, '2024-03-01 10:00:00', 'Healthcare sector investment'),
+(9, 7, 11, 'BUY', 150, 196.50, '2024-03-06 09:15:00', 'Financial sector exposure'),
+(10, 4, 12, 'BUY', 50, 180.00, '2024-03-16 10:30:00', 'Amazon starter position'),
+(2, 5, 3, 'SELL', 20, 175.00, '2024-03-20 15:30:00', 'Partial Tesla profit taking');
 
 -- ============================================
 -- Populate Watchlists Table (10 rows)
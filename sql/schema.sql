@@ -74,7 +74,9 @@ CREATE TABLE Transactions (
     transaction_type ENUM('BUY', 'SELL') NOT NULL,
     quantity INT NOT NULL CHECK (quantity > 0),
     price_per_share DECIMAL(10, 2) NOT NULL CHECK (price_per_share > 0),
-    total_amount DECIMAL(15, 2) NOT NULL CHECK (total_amount > 0),
+    -- Derived by MySQL so it always matches quantity * price_per_share.
+    -- Existing databases: run sql/migrations/001_transactions_total_amount_generated.sql
+    total_amount DECIMAL(15, 2) GENERATED ALWAYS AS (quantity * price_per_share) STORED,
     transaction_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     notes TEXT,
     CONSTRAINT fk_transaction_user FOREIGN KEY (user_id)
@@ -119,12 +121,12 @@ CREATE TABLE Watchlists (
 -- ============================================
 -- Create Indexes for Performance
 -- ============================================
-CREATE INDEX idx_users_username ON Users(username);
-CREATE INDEX idx_users_email ON Users(email);
-CREATE INDEX idx_stocks_ticker ON Stocks(ticker_symbol);
-CREATE INDEX idx_stocks_sector ON Stocks(sector);
+-- Users.username, Users.email and Stocks.ticker_symbol are declared UNIQUE,
+-- which already creates the unique index used by the username/ticker lookups
+CREATE INDEX idx_stocks_sector_ticker ON Stocks(sector, ticker_symbol);
 CREATE INDEX idx_portfolios_user ON Portfolios(user_id);
-CREATE INDEX idx_watchlists_user ON Watchlists(user_id);
+CREATE INDEX idx_watchlists_user_date ON Watchlists(user_id, added_date DESC);
+CREATE INDEX idx_watchlists_user_alert ON Watchlists(user_id, alert_enabled);
 
 -- ============================================
 -- Summary of Foreign Key Relationships:
@@ -0,0 +1,31 @@
+"""
+Stock Portfolio Tracker - API Client Unit Tests
+Checks StockTrackerAPIClient construction; no API server is needed.
+
+Run with: python -m pytest test_api_client.py
+"""
+
+from api_client import StockTrackerAPIClient
+
+
+def test_client_builds_endpoint_urls():
+    """Endpoint URLs are built from the base URL at construction."""
+    with StockTrackerAPIClient(base_url="http://localhost:8000") as client:
+        assert client._url_health == "http://localhost:8000/health"
+        assert client._url_batch == "http://localhost:8000/api/v1/batch"
+        assert client._url_users == "http://localhost:8000/api/v1/users"
+        assert client._url_stocks == "http://localhost:8000/api/v1/stocks"
+        assert client._url_portfolios == "http://localhost:8000/api/v1/portfolios"
+        assert client._url_transactions == "http://localhost:8000/api/v1/transactions"
+        assert client._url_watchlist == "http://localhost:8000/api/v1/watchlist"
+        assert client._url_user_balance.format(7) == "http://localhost:8000/api/v1/users/7/balance"
+
+
+def test_client_retries_only_idempotent_methods():
+    """Non-idempotent writes and plain 500s are never retried."""
+    with StockTrackerAPIClient(base_url="http://localhost:8000") as client:
+        retry = client.session.get_adapter("http://localhost:8000").max_retries
+        assert retry.is_retry("GET", 503)
+        assert not retry.is_retry("PUT", 503)
+        assert not retry.is_retry("POST", 502)
+        assert not retry.is_retry("GET", 500)
@@ -0,0 +1,110 @@
+"""
+Stock Portfolio Tracker - Business Layer Unit Tests
+Checks the bulk create paths with the DAO writes replaced; no database is needed.
+
+Run with: python -m pytest test_business_layer.py
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from business_layer import BusinessRuleException, StockBusinessLogic, UserBusinessLogic
+from data_access_layer import StockDAO, UserDAO
+
+
+def test_create_stocks_bulk_rounds_prices_to_cents(monkeypatch):
+    """Float prices are stored as cent-quantized Decimals, as in create_stock()."""
+    inserted = []
+    monkeypatch.setattr(StockDAO, "create_many", lambda rows: inserted.extend(rows) or len(rows))
+
+    result = StockBusinessLogic.create_stocks_bulk([
+        {"ticker": "abc", "company_name": "ABC Corp", "current_price": 12.346,
+         "market_cap": 1000, "sector": "Technology"},
+        {"ticker": "XYZ", "company_name": "XYZ Inc", "current_price": 0.1,
+         "market_cap": 2000, "sector": "Energy", "industry": "Oil"},
+    ])
+
+    assert result["success"] and result["created"] == 2
+    assert result["tickers"] == ["ABC", "XYZ"]
+    assert inserted[0][:3] == ("ABC", "ABC Corp", Decimal("12.35"))
+    assert inserted[1][2] == Decimal("0.10")
+
+
+def test_create_stocks_bulk_rejects_batch_before_writing(monkeypatch):
+    """One invalid record fails the whole batch and nothing is inserted."""
+    monkeypatch.setattr(StockDAO, "create_many", lambda rows: pytest.fail("batch was written"))
+
+    with pytest.raises(BusinessRuleException, match="Stock record 1"):
+        StockBusinessLogic.create_stocks_bulk([
+            {"ticker": "ABC", "company_name": "ABC Corp", "current_price": 10.0,
+             "market_cap": 1000, "sector": "Technology"},
+            {"ticker": "BAD", "company_name": "Bad Co", "current_price": -1.0,
+             "market_cap": 1000, "sector": "Technology"},
+        ])
+
+
+def test_create_users_bulk_rounds_balances_to_cents(monkeypatch):
+    """Float balances are cent-quantized and the batch is inserted in one call."""
+    inserted = []
+    monkeypatch.setattr(UserDAO, "create_many",
+                        lambda rows: inserted.extend(rows) or list(range(1, len(rows) + 1)))
+
+    result = UserBusinessLogic.create_users_bulk([
+        {"username": "alice", "email": "alice@example.com", "password": "password123",
+         "first_name": "Alice", "last_name": "A", "initial_balance": 2500.009},
+        {"username": "bob", "email": "bob@example.com", "password": "password456",
+         "first_name": "Bob", "last_name": "B"},
+    ])
+
+    assert result["success"] and result["user_ids"] == [1, 2]
+    assert inserted[0][5] == Decimal("2500.01")
+    assert inserted[1][5] == Decimal("10000.00")
+
+
+def test_create_users_bulk_rejects_batch_before_writing(monkeypatch):
+    """One invalid record fails the whole batch and no user is created."""
+    monkeypatch.setattr(UserDAO, "create_many", lambda rows: pytest.fail("batch was written"))
+
+    with pytest.raises(BusinessRuleException, match="User record 0"):
+        UserBusinessLogic.create_users_bulk([
+            {"username": "alice", "email": "not-an-email", "password": "password123",
+             "first_name": "Alice", "last_name": "A"},
+        ])
+
+
+def test_create_users_bulk_requires_names(monkeypatch):
+    """A record missing first_name is rejected with its index, before any write."""
+    monkeypatch.setattr(UserDAO, "create_many", lambda rows: pytest.fail("batch was written"))
+
+    with pytest.raises(BusinessRuleException, match="User record 1"):
+        UserBusinessLogic.create_users_bulk([
+            {"username": "alice", "email": "alice@example.com", "password": "password123",
+             "first_name": "Alice", "last_name": "A"},
+            {"username": "bob", "email": "bob@example.com", "password": "password456",
+             "last_name": "B"},
+        ])
+
+
+def test_create_users_bulk_reports_rolled_back_batch(monkeypatch):
+    """A batch the database rejects (e.g. a duplicate username) creates nothing."""
+    monkeypatch.setattr(UserDAO, "create_many", lambda rows: [])
+
+    result = UserBusinessLogic.create_users_bulk([
+        {"username": "alice", "email": "alice@example.com", "password": "password123",
+         "first_name": "Alice", "last_name": "A"},
+    ])
+
+    assert not result["success"] and result["created"] == 0
+
+
+def test_create_stocks_bulk_rejects_non_finite_price(monkeypatch):
+    """Infinity, NaN and out-of-range prices are a business rule error, not a crash."""
+    monkeypatch.setattr(StockDAO, "create_many", lambda rows: pytest.fail("batch was written"))
+
+    for price in (float("inf"), float("nan"), 1e30):
+        with pytest.raises(BusinessRuleException, match="Stock record 0: Invalid amount"):
+            StockBusinessLogic.create_stocks_bulk([
+                {"ticker": "ABC", "company_name": "ABC Corp", "current_price": price,
+                 "market_cap": 1000, "sector": "Technology"},
+            ])
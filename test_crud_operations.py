@@ -9,9 +9,92 @@ PREREQUISITES:
 - Database must be populated with test data
 """
 
+import orjson
 import requests
+import threading
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Request payloads. They never change, so each suite's batch pipeline is
+# built and JSON-encoded once at import rather than on every run.
+CREATE_STOCK_DATA = {
+    "ticker_symbol": "CRUD",
+    "company_name": "CRUD Test Company",
+    "current_price": 150.75,
+    "market_cap": 10000000000,
+    "sector": "Technology",
+    "industry": "Software Testing"
+}
+UPDATE_STOCK_DATA = {"new_price": 175.50}
+
+CREATE_USER_DATA = {
+    "username": "testuser123",
+    "email": "testuser@example.com",
+    "password": "securepass123",
+    "first_name": "Test",
+    "last_name": "User",
+    "initial_balance": 25000.00
+}
+UPDATE_USER_DATA = {
+    "amount": 5000.00,
+    "operation": "add"
+}
+
+CREATE_PORTFOLIO_DATA = {
+    "user_id": 1,  # Using existing user
+    "portfolio_name": "Test CRUD Portfolio",
+    "description": "Portfolio created for CRUD testing"
+}
+
+CREATE_TRANSACTION_DATA = {
+    "user_id": 1,
+    "stock_id": 1,
+    "portfolio_id": 1,
+    "transaction_type": "BUY",
+    "quantity": 10,
+    "price_per_share": 178.25,
+    "notes": "CRUD test transaction"
+}
+
+
+def _encode_pipeline(calls):
+    """JSON body for /api/v1/batch."""
+    return orjson.dumps({"pipeline": calls})
+
+
+# Later calls use the new record's ID from the first call's result
+STOCK_BATCH = _encode_pipeline([
+    {"method": "POST", "path": "/stocks", "body": CREATE_STOCK_DATA},
+    {"method": "GET", "path": "/stocks/{$0.stock_id}"},
+    {"method": "GET", "path": "/stocks/ticker/CRUD"},
+    {"method": "PUT", "path": "/stocks/{$0.stock_id}/price", "body": UPDATE_STOCK_DATA},
+    {"method": "DELETE", "path": "/stocks/{$0.stock_id}"},
+    {"method": "GET", "path": "/stocks/{$0.stock_id}"},
+])
+USER_BATCH = _encode_pipeline([
+    {"method": "POST", "path": "/users", "body": CREATE_USER_DATA},
+    {"method": "GET", "path": "/users/{$0.user_id}"},
+    {"method": "PUT", "path": "/users/{$0.user_id}/balance", "body": UPDATE_USER_DATA},
+    {"method": "DELETE", "path": "/users/{$0.user_id}"},
+])
+PORTFOLIO_BATCH = _encode_pipeline([
+    {"method": "POST", "path": "/portfolios", "body": CREATE_PORTFOLIO_DATA},
+    {"method": "GET", "path": "/portfolios/{$0.portfolio_id}"},
+    {"method": "DELETE", "path": "/portfolios/{$0.portfolio_id}"},
+])
+TRANSACTION_BATCH = _encode_pipeline([
+    {"method": "POST", "path": "/transactions", "body": CREATE_TRANSACTION_DATA},
+    {"method": "GET", "path": "/transactions/{$0.transaction_id}"},
+    {"method": "DELETE", "path": "/transactions/{$0.transaction_id}"},
+])
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _pretty(body):
+    """Indented JSON for printing a response body."""
+    return orjson.dumps(body, option=orjson.OPT_INDENT_2).decode()
 
 
 class CRUDTester:
@@ -20,318 +103,243 @@ class CRUDTester:
     def __init__(self, base_url="https://csce-548-stock-tracker-production.up.railway.app"):
         self.base_url = base_url
         self.api_v1 = f"{base_url}/api/v1"
-        self.test_results = []
+        self.health_url = f"{base_url}/health"
+        self.batch_url = f"{self.api_v1}/batch"
+        self.passed = 0
+        self.failed = 0
+        self.failures = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._sessions = []
+
+    @property
+    def session(self):
+        """
+        This thread's HTTP session. Keep-alive reuses its connection instead
+        of opening (and TLS-handshaking) a new one per request; each suite
+        thread gets its own, since a Session isn't safe to share.
+        """
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def close(self):
+        """Close every HTTP session's pooled connections."""
+        with self._lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions.clear()
+
+    def _print(self, text):
+        """Print, or buffer the line while a suite runs so output isn't interleaved."""
+        output = getattr(self._local, 'output', None)
+        if output is None:
+            print(text)
+        else:
+            output.append(text)
+
+    def _run_suite(self, test):
+        """Run one test suite, then print its buffered output in one piece."""
+        self._local.output = []
+        try:
+            test()
+        finally:
+            output, self._local.output = self._local.output, None
+            with self._lock:
+                print("\n".join(output))
+
+    def _call(self, method, url, test_name, *, data=None, expect=200, timeout=None):
+        """
+        Make one HTTP request and return its decoded JSON body. On a request
+        error or an unexpected status, log test_name as failed and return None.
+        """
+        try:
+            response = self.session.request(method, url, data=data, timeout=timeout,
+                                            headers=JSON_HEADERS if data is not None else None)
+        except requests.exceptions.RequestException as e:
+            self.log_test(test_name, False, str(e))
+            return None
+        if response.status_code != expect:
+            self.log_test(test_name, False, f"Status code: {response.status_code}")
+            return None
+        return orjson.loads(response.content)
+
+    def _batch(self, test_name, body):
+        """
+        Send an encoded pipeline (see _encode_pipeline) in one round trip
+        through /api/v1/batch and return the calls' results ({"status": ...,
+        "body": ...}) in order, or None (logged as test_name) if it fails.
+        The server runs consecutive GETs concurrently, and a path can use a
+        field of an earlier call's result, e.g. "/stocks/{$0.stock_id}".
+        """
+        response = self._call("POST", self.batch_url, test_name, data=body)
+        return None if response is None else response['results']
+
+    def _check(self, test_name, result, describe):
+        """
+        Log one batch result: a pass (with describe(body) as the details) for
+        a 2xx status, otherwise a failure. Returns the body, or None on failure.
+        """
+        if not 200 <= result['status'] < 300:
+            self.log_test(test_name, False,
+                          f"HTTP {result['status']}: {result['body'].get('detail')}")
+            return None
+        self.log_test(test_name, True, describe(result['body']))
+        return result['body']
 
     def log_test(self, test_name, success, details=""):
-        """Log test result."""
-        status = "✓ PASS" if success else "✗ FAIL"
+        """Log test result, keeping the pass/fail tallies print_summary reports."""
         result = {
             'test': test_name,
-            'status': status,
+            'success': success,
             'details': details,
-            'timestamp': datetime.now().isoformat()
+            'ts_ns': time.time_ns()  # format with datetime.fromtimestamp(ts_ns / 1e9) if needed
         }
-        self.test_results.append(result)
-        print(f"{status}: {test_name}")
+        with self._lock:
+            if success:
+                self.passed += 1
+            else:
+                self.failed += 1
+                self.failures.append(result)
+        self._print(f"{'✓ PASS' if success else '✗ FAIL'}: {test_name}")
         if details:
-            print(f"   Details: {details}")
+            self._print(f"   Details: {details}")
 
     def check_server(self):
         """Check if API server is running."""
-        print("\n" + "=" * 70)
-        print("Checking API Server Connection...")
-        print("=" * 70)
-        try:
-            response = requests.get(f"{self.base_url}/health", timeout=2)
-            if response.status_code == 200:
-                self.log_test("Server Connection", True, "API server is online")
-                return True
-            else:
-                self.log_test("Server Connection", False, f"Status code: {response.status_code}")
-                return False
-        except requests.exceptions.RequestException as e:
-            self.log_test("Server Connection", False, str(e))
-            print("\n✗ ERROR: Cannot connect to API server!")
-            print("Please start the server first:")
-            print("  py -m uvicorn service_layer:app --reload")
+        self._print("\n" + "=" * 70)
+        self._print("Checking API Server Connection...")
+        self._print("=" * 70)
+        if self._call("GET", self.health_url, "Server Connection", timeout=2) is None:
+            self._print("\n✗ ERROR: Cannot connect to API server!")
+            self._print("Please start the server first:")
+            self._print("  py -m uvicorn service_layer:app --reload")
             return False
+        self.log_test("Server Connection", True, "API server is online")
+        return True
 
     def test_stock_crud(self):
         """Test full CRUD cycle for Stocks."""
-        print("\n" + "=" * 70)
-        print("Testing STOCK Entity - Full CRUD Cycle")
-        print("=" * 70)
+        self._print("\n" + "=" * 70)
+        self._print("Testing STOCK Entity - Full CRUD Cycle")
+        self._print("=" * 70)
+
+        # The whole cycle goes out as one batch
+        self._print(f"\nSending batched CRUD requests to: {self.batch_url}")
+        self._print(f"Request data: {CREATE_STOCK_DATA}")
+        self._print(f"Update data: {UPDATE_STOCK_DATA}")
+        results = self._batch("CREATE Stock", STOCK_BATCH)
+        if results is None:
+            return
+        created, by_id, by_ticker, updated, deleted, verify = results
 
         # CREATE
-        print("\n--- CREATE Operation ---")
-        create_data = {
-            "ticker_symbol": "CRUD",
-            "company_name": "CRUD Test Company",
-            "current_price": 150.75,
-            "market_cap": 10000000000,
-            "sector": "Technology",
-            "industry": "Software Testing"
-        }
-
-        print(f"Sending POST request to: {self.api_v1}/stocks")
-        print(f"Request data: {create_data}")
-
-        try:
-            response = requests.post(f"{self.api_v1}/stocks", json=create_data)
-            response.raise_for_status()
-            result = response.json()
-            print(f"✓ Response received:")
-            import json
-            print(json.dumps(result, indent=2))
-            stock_id = result.get('stock_id')
-            self.log_test("CREATE Stock", True, f"Stock ID: {stock_id}, Ticker: CRUD")
-        except requests.exceptions.RequestException as e:
-            self.log_test("CREATE Stock", False, str(e))
+        self._print("\n--- CREATE Operation ---")
+        result = self._check("CREATE Stock", created,
+                             lambda r: f"Stock ID: {r.get('stock_id')}, Ticker: CRUD")
+        if result is None:
             return
-
-        time.sleep(0.5)
+        self._print(_pretty(result))
 
         # READ
-        print("\n--- READ Operation ---")
-        print(f"Sending GET request to: {self.api_v1}/stocks/{stock_id}")
-        try:
-            response = requests.get(f"{self.api_v1}/stocks/{stock_id}")
-            response.raise_for_status()
-            stock = response.json()
-            print(f"✓ Response received:")
-            import json
-            print(json.dumps(stock, indent=2, default=str))
-            self.log_test("READ Stock by ID", True,
-                         f"Retrieved: {stock['ticker_symbol']} - ${stock['current_price']}")
-        except requests.exceptions.RequestException as e:
-            self.log_test("READ Stock by ID", False, str(e))
-
-        try:
-            response = requests.get(f"{self.api_v1}/stocks/ticker/CRUD")
-            response.raise_for_status()
-            stock = response.json()
-            self.log_test("READ Stock by Ticker", True,
-                         f"Found by ticker: {stock['company_name']}")
-        except requests.exceptions.RequestException as e:
-            self.log_test("READ Stock by Ticker", False, str(e))
-
-        time.sleep(0.5)
+        self._print("\n--- READ Operation ---")
+        stock = self._check("READ Stock by ID", by_id,
+                            lambda r: f"Retrieved: {r['ticker_symbol']} - ${r['current_price']}")
+        if stock is not None:
+            self._print(_pretty(stock))
+        self._check("READ Stock by Ticker", by_ticker,
+                    lambda r: f"Found by ticker: {r['company_name']}")
 
         # UPDATE
-        print("\n--- UPDATE Operation ---")
-        update_data = {"new_price": 175.50}
-        print(f"Sending PUT request to: {self.api_v1}/stocks/{stock_id}/price")
-        print(f"Update data: {update_data}")
-        try:
-            response = requests.put(f"{self.api_v1}/stocks/{stock_id}/price", json=update_data)
-            response.raise_for_status()
-            result = response.json()
-            print(f"✓ Response received:")
-            import json
-            print(json.dumps(result, indent=2, default=str))
-            self.log_test("UPDATE Stock Price", True,
-                         f"Price updated: ${result['old_price']} → ${result['new_price']}")
-        except requests.exceptions.RequestException as e:
-            self.log_test("UPDATE Stock Price", False, str(e))
-
-        time.sleep(0.5)
+        self._print("\n--- UPDATE Operation ---")
+        result = self._check("UPDATE Stock Price", updated,
+                             lambda r: f"Price updated: ${r['old_price']} → ${r['new_price']}")
+        if result is not None:
+            self._print(_pretty(result))
 
         # DELETE
-        print("\n--- DELETE Operation ---")
-        print(f"Sending DELETE request to: {self.api_v1}/stocks/{stock_id}")
-        try:
-            response = requests.delete(f"{self.api_v1}/stocks/{stock_id}")
-            response.raise_for_status()
-            result = response.json()
-            print(f"✓ Response received:")
-            import json
-            print(json.dumps(result, indent=2))
-            self.log_test("DELETE Stock", True, result['message'])
-        except requests.exceptions.RequestException as e:
-            self.log_test("DELETE Stock", False, str(e))
+        self._print("\n--- DELETE Operation ---")
+        result = self._check("DELETE Stock", deleted, lambda r: r['message'])
+        if result is not None:
+            self._print(_pretty(result))
 
         # Verify deletion
-        print("\n--- Verify Deletion ---")
-        print(f"Sending GET request to verify deletion: {self.api_v1}/stocks/{stock_id}")
-        try:
-            response = requests.get(f"{self.api_v1}/stocks/{stock_id}")
-            if response.status_code == 404:
-                print(f"✓ Stock not found (HTTP 404) - Deletion confirmed!")
-                self.log_test("Verify Deletion", True, "Stock no longer exists (404)")
-            else:
-                print(f"✗ Stock still exists (HTTP {response.status_code})")
-                self.log_test("Verify Deletion", False, "Stock still exists")
-        except requests.exceptions.RequestException as e:
-            print(f"✓ Stock not found - Deletion confirmed!")
-            self.log_test("Verify Deletion", True, "Stock not found (as expected)")
+        self._print("\n--- Verify Deletion ---")
+        if verify['status'] == 404:
+            self._print(f"✓ Stock not found (HTTP 404) - Deletion confirmed!")
+            self.log_test("Verify Deletion", True, "Stock no longer exists (404)")
+        else:
+            self._print(f"✗ Stock still exists (HTTP {verify['status']})")
+            self.log_test("Verify Deletion", False, "Stock still exists")
 
     def test_user_crud(self):
         """Test full CRUD cycle for Users."""
-        print("\n" + "=" * 70)
-        print("Testing USER Entity - Full CRUD Cycle")
-        print("=" * 70)
+        self._print("\n" + "=" * 70)
+        self._print("Testing USER Entity - Full CRUD Cycle")
+        self._print("=" * 70)
 
-        # CREATE
-        print("\n--- CREATE Operation ---")
-        create_data = {
-            "username": "testuser123",
-            "email": "testuser@example.com",
-            "password": "securepass123",
-            "first_name": "Test",
-            "last_name": "User",
-            "initial_balance": 25000.00
-        }
-
-        try:
-            response = requests.post(f"{self.api_v1}/users", json=create_data)
-            response.raise_for_status()
-            result = response.json()
-            user_id = result.get('user_id')
-            self.log_test("CREATE User", True, f"User ID: {user_id}, Username: testuser123")
-        except requests.exceptions.RequestException as e:
-            self.log_test("CREATE User", False, str(e))
+        results = self._batch("CREATE User", USER_BATCH)
+        if results is None:
             return
+        created, read, updated, deleted = results
 
-        time.sleep(0.5)
-
-        # READ
-        print("\n--- READ Operation ---")
-        try:
-            response = requests.get(f"{self.api_v1}/users/{user_id}")
-            response.raise_for_status()
-            user = response.json()
-            self.log_test("READ User", True,
-                         f"Retrieved: {user['username']}, Balance: ${user['account_balance']}")
-        except requests.exceptions.RequestException as e:
-            self.log_test("READ User", False, str(e))
-
-        time.sleep(0.5)
-
-        # UPDATE
-        print("\n--- UPDATE Operation ---")
-        update_data = {
-            "amount": 5000.00,
-            "operation": "add"
-        }
-        try:
-            response = requests.put(f"{self.api_v1}/users/{user_id}/balance", json=update_data)
-            response.raise_for_status()
-            result = response.json()
-            self.log_test("UPDATE User Balance", True,
-                         f"Balance: ${result['previous_balance']} → ${result['new_balance']}")
-        except requests.exceptions.RequestException as e:
-            self.log_test("UPDATE User Balance", False, str(e))
-
-        time.sleep(0.5)
-
-        # DELETE
-        print("\n--- DELETE Operation ---")
-        try:
-            response = requests.delete(f"{self.api_v1}/users/{user_id}")
-            response.raise_for_status()
-            result = response.json()
-            self.log_test("DELETE User", True, result['message'])
-        except requests.exceptions.RequestException as e:
-            self.log_test("DELETE User", False, str(e))
+        self._print("\n--- CREATE Operation ---")
+        if self._check("CREATE User", created,
+                       lambda r: f"User ID: {r.get('user_id')}, Username: testuser123") is None:
+            return
+        self._print("\n--- READ Operation ---")
+        self._check("READ User", read,
+                    lambda r: f"Retrieved: {r['username']}, Balance: ${r['account_balance']}")
+        self._print("\n--- UPDATE Operation ---")
+        self._check("UPDATE User Balance", updated,
+                    lambda r: f"Balance: ${r['previous_balance']} → ${r['new_balance']}")
+        self._print("\n--- DELETE Operation ---")
+        self._check("DELETE User", deleted, lambda r: r['message'])
 
     def test_portfolio_crud(self):
         """Test full CRUD cycle for Portfolios."""
-        print("\n" + "=" * 70)
-        print("Testing PORTFOLIO Entity - Full CRUD Cycle")
-        print("=" * 70)
+        self._print("\n" + "=" * 70)
+        self._print("Testing PORTFOLIO Entity - Full CRUD Cycle")
+        self._print("=" * 70)
 
-        # CREATE
-        print("\n--- CREATE Operation ---")
-        create_data = {
-            "user_id": 1,  # Using existing user
-            "portfolio_name": "Test CRUD Portfolio",
-            "description": "Portfolio created for CRUD testing"
-        }
-
-        try:
-            response = requests.post(f"{self.api_v1}/portfolios", json=create_data)
-            response.raise_for_status()
-            result = response.json()
-            portfolio_id = result.get('portfolio_id')
-            self.log_test("CREATE Portfolio", True, f"Portfolio ID: {portfolio_id}")
-        except requests.exceptions.RequestException as e:
-            self.log_test("CREATE Portfolio", False, str(e))
+        results = self._batch("CREATE Portfolio", PORTFOLIO_BATCH)
+        if results is None:
             return
+        created, read, deleted = results
 
-        time.sleep(0.5)
-
-        # READ
-        print("\n--- READ Operation ---")
-        try:
-            response = requests.get(f"{self.api_v1}/portfolios/{portfolio_id}")
-            response.raise_for_status()
-            portfolio = response.json()
-            self.log_test("READ Portfolio", True,
-                         f"Retrieved: {portfolio['portfolio_name']}")
-        except requests.exceptions.RequestException as e:
-            self.log_test("READ Portfolio", False, str(e))
-
-        time.sleep(0.5)
-
-        # DELETE
-        print("\n--- DELETE Operation ---")
-        try:
-            response = requests.delete(f"{self.api_v1}/portfolios/{portfolio_id}")
-            response.raise_for_status()
-            result = response.json()
-            self.log_test("DELETE Portfolio", True, result['message'])
-        except requests.exceptions.RequestException as e:
-            self.log_test("DELETE Portfolio", False, str(e))
+        self._print("\n--- CREATE Operation ---")
+        if self._check("CREATE Portfolio", created,
+                       lambda r: f"Portfolio ID: {r.get('portfolio_id')}") is None:
+            return
+        self._print("\n--- READ Operation ---")
+        self._check("READ Portfolio", read, lambda r: f"Retrieved: {r['portfolio_name']}")
+        self._print("\n--- DELETE Operation ---")
+        self._check("DELETE Portfolio", deleted, lambda r: r['message'])
 
     def test_transaction_crud(self):
         """Test Transaction creation and retrieval."""
-        print("\n" + "=" * 70)
-        print("Testing TRANSACTION Entity - Create & Read")
-        print("=" * 70)
+        self._print("\n" + "=" * 70)
+        self._print("Testing TRANSACTION Entity - Create & Read")
+        self._print("=" * 70)
 
-        # CREATE
-        print("\n--- CREATE Operation ---")
-        create_data = {
-            "user_id": 1,
-            "stock_id": 1,
-            "portfolio_id": 1,
-            "transaction_type": "BUY",
-            "quantity": 10,
-            "price_per_share": 178.25,
-            "notes": "CRUD test transaction"
-        }
-
-        try:
-            response = requests.post(f"{self.api_v1}/transactions", json=create_data)
-            response.raise_for_status()
-            result = response.json()
-            transaction_id = result.get('transaction_id')
-            self.log_test("CREATE Transaction", True,
-                         f"Transaction ID: {transaction_id}, Total: ${result['total_amount']}")
-        except requests.exceptions.RequestException as e:
-            self.log_test("CREATE Transaction", False, str(e))
+        results = self._batch("CREATE Transaction", TRANSACTION_BATCH)
+        if results is None:
             return
+        created, read, deleted = results
 
-        time.sleep(0.5)
-
-        # READ
-        print("\n--- READ Operation ---")
-        try:
-            response = requests.get(f"{self.api_v1}/transactions/{transaction_id}")
-            response.raise_for_status()
-            transaction = response.json()
-            self.log_test("READ Transaction", True,
-                         f"Type: {transaction['transaction_type']}, Qty: {transaction['quantity']}")
-        except requests.exceptions.RequestException as e:
-            self.log_test("READ Transaction", False, str(e))
-
+        self._print("\n--- CREATE Operation ---")
+        if self._check("CREATE Transaction", created,
+                       lambda r: f"Transaction ID: {r.get('transaction_id')}, "
+                                 f"Total: ${r['total_amount']}") is None:
+            return
+        self._print("\n--- READ Operation ---")
+        self._check("READ Transaction", read,
+                    lambda r: f"Type: {r['transaction_type']}, Qty: {r['quantity']}")
         # DELETE (cleanup)
-        try:
-            response = requests.delete(f"{self.api_v1}/transactions/{transaction_id}")
-            response.raise_for_status()
-            self.log_test("DELETE Transaction (cleanup)", True, "Removed test transaction")
-        except requests.exceptions.RequestException as e:
-            self.log_test("DELETE Transaction (cleanup)", False, str(e))
+        self._check("DELETE Transaction (cleanup)", deleted, lambda r: "Removed test transaction")
 
     def print_summary(self):
         """Print test summary."""
@@ -339,9 +347,8 @@ class CRUDTester:
         print(" " * 25 + "TEST SUMMARY")
         print("=" * 70)
 
-        total = len(self.test_results)
-        passed = len([r for r in self.test_results if "PASS" in r['status']])
-        failed = total - passed
+        passed, failed = self.passed, self.failed
+        total = passed + failed
 
         print(f"\nTotal Tests: {total}")
         print(f"✓ Passed:    {passed}")
@@ -350,9 +357,8 @@ class CRUDTester:
 
         if failed > 0:
             print("\nFailed Tests:")
-            for result in self.test_results:
-                if "FAIL" in result['status']:
-                    print(f"  - {result['test']}: {result['details']}")
+            for result in self.failures:
+                print(f"  - {result['test']}: {result['details']}")
 
         print("\n" + "=" * 70)
         print("All operations were performed via REST API")
@@ -367,17 +373,20 @@ class CRUDTester:
         print(" " * 20 + "Project 2 - CSCE 548")
         print("=" * 70)
 
-        if not self.check_server():
-            return
-
-        # Run all tests
-        self.test_stock_crud()
-        self.test_user_crud()
-        self.test_portfolio_crud()
-        self.test_transaction_crud()
-
-        # Print summary
-        self.print_summary()
+        try:
+            if not self.check_server():
+                return
+
+            # Run all tests; the suites use separate records, so they run concurrently
+            suites = [self.test_stock_crud, self.test_user_crud,
+                      self.test_portfolio_crud, self.test_transaction_crud]
+            with ThreadPoolExecutor(max_workers=len(suites)) as executor:
+                list(executor.map(self._run_suite, suites))
+
+            # Print summary
+            self.print_summary()
+        finally:
+            self.close()
 
 
 def main():